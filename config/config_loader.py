@@ -9,7 +9,9 @@ import os
 import sys
 import logging
 import configparser
-from typing import Dict, Any, Optional, Union, List, Tuple
+import tempfile
+import threading
+from typing import Dict, Any, Optional, Union, List, Tuple, Callable, Set
 from pathlib import Path
 
 # Import utility functions
@@ -27,6 +29,125 @@ logger = logging.getLogger(__name__)
 # Default configuration file path
 DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'default_config.ini')
 
+# Prefix for environment variables overriding configuration options
+_ENV_PREFIX = 'SLOWJAMS_'
+
+# Platform detection does not change during the process lifetime
+_IS_WINDOWS = (os.name == 'nt')
+
+# Home directory, expanded once instead of on every path lookup
+_HOME = os.path.expanduser('~')
+
+# Environment lookups used to locate the configuration directory
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _cached_env(name: str) -> Optional[str]:
+    """
+    Get an environment variable, reading it from the process environment only once.
+    
+    Args:
+        name: Environment variable name.
+        
+    Returns:
+        The environment variable value, or None if it is not set.
+    """
+    if name not in _ENV_CACHE:
+        _ENV_CACHE[name] = os.environ.get(name)
+    return _ENV_CACHE[name]
+
+
+def _expand(path: str) -> str:
+    """
+    Expand a leading ``~`` in a path using the cached home directory.
+    
+    Args:
+        path: Path that may start with ``~``.
+        
+    Returns:
+        The expanded path.
+    """
+    if path == '~':
+        return _HOME
+    if path.startswith('~/') or (_IS_WINDOWS and path.startswith('~\\')):
+        return _HOME + path[1:]
+    # ~user and other forms still need the full expansion
+    return os.path.expanduser(path)
+
+
+def _join(base: str, name: str) -> str:
+    """
+    Join a directory and a relative POSIX-style name on the startup path.
+    
+    Plain string concatenation is used on POSIX; Windows keeps os.path.join
+    for drive-letter and separator handling.
+    
+    Args:
+        base: Base directory.
+        name: Relative path using ``/`` separators.
+        
+    Returns:
+        The joined path.
+    """
+    if _IS_WINDOWS:
+        return os.path.join(base, *name.split('/'))
+    if base.endswith('/'):
+        return base + name
+    return f"{base}/{name}"
+
+
+def _read_text(path: str) -> str:
+    """
+    Read a configuration file into memory.
+    
+    Args:
+        path: Path to the file.
+        
+    Returns:
+        The file contents.
+        
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# Parsed default configuration, loaded on first use
+_DEFAULT_CONFIG: Optional[configparser.ConfigParser] = None
+
+
+def _load_default() -> configparser.ConfigParser:
+    """
+    Get the parsed default configuration, reading it from disk only once.
+    
+    Returns:
+        The default configuration parser. Callers must not modify it.
+    """
+    global _DEFAULT_CONFIG
+    
+    if _DEFAULT_CONFIG is None:
+        default_config = configparser.ConfigParser(interpolation=None, dict_type=dict)
+        default_config.read(DEFAULT_CONFIG_PATH)
+        _DEFAULT_CONFIG = default_config
+    
+    return _DEFAULT_CONFIG
+
+
+# Marker for cache misses in ConfigLoader._value_cache
+_SENTINEL = object()
+
+# Options backing the precomputed ConfigLoader attributes
+_DERIVED_OPTIONS = frozenset({
+    ('Advanced', 'simulation_mode'),
+    ('General', 'download_directory'),
+    ('General', 'temp_directory'),
+})
+
+# Boolean spellings accepted by configparser
+_TRUE = frozenset({'1', 'yes', 'true', 'on'})
+_FALSE = frozenset({'0', 'no', 'false', 'off'})
+
 
 class ConfigLoader:
     """
@@ -44,35 +165,70 @@ class ConfigLoader:
             config_dir: Optional directory for configuration files.
             user_config_path: Optional path to user configuration file.
         """
-        self.config = configparser.ConfigParser(interpolation=configparser.BasicInterpolation())
+        # default_config.ini does not use %(name)s interpolation, so skip it entirely
+        self.config = configparser.ConfigParser(interpolation=None, dict_type=dict)
+        
+        # Raw values keyed by (section, option), rebuilt whenever the parser changes
+        self._flat: Dict[Tuple[str, str], str] = {}
+        
+        # Keys changed by set_value that are not yet mirrored into self.config
+        self._dirty: Set[Tuple[str, str]] = set()
+        
+        # Converted values keyed by (type, section, option[, extra])
+        self._value_cache: Dict[Tuple[str, ...], Any] = {}
+        
+        # Directories already created or known to exist
+        self._ensured_dirs: Set[str] = set()
+        
+        # Hot-path settings, recomputed whenever their options change
+        self.simulation_mode: bool = False
+        self._download_dir: str = os.path.join(_HOME, 'Downloads')
+        self.download_directory: Path = Path(self._download_dir)
+        self._temp_dir: str = os.path.join(tempfile.gettempdir(), 'slowjams')
+        self._temp_dir_path: Path = Path(self._temp_dir)
         
         # Set configuration directory
         if config_dir is None:
-            if os.environ.get('SLOWJAMS_CONFIG_DIR'):
-                self.config_dir = os.environ.get('SLOWJAMS_CONFIG_DIR')
-            elif os.environ.get('APPDATA'):  # Windows
-                self.config_dir = os.path.join(os.environ.get('APPDATA'), 'SlowJams')
-            elif os.environ.get('XDG_CONFIG_HOME'):  # Linux
-                self.config_dir = os.path.join(os.environ.get('XDG_CONFIG_HOME'), 'slowjams')
-            elif os.path.exists(os.path.expanduser('~/.config')):  # Linux/Mac
-                self.config_dir = os.path.expanduser('~/.config/slowjams')
+            cfg = _cached_env('SLOWJAMS_CONFIG_DIR')
+            appdata = _cached_env('APPDATA')
+            xdg = _cached_env('XDG_CONFIG_HOME')
+            
+            if cfg:
+                self.config_dir = cfg
+            elif appdata:  # Windows
+                self.config_dir = _join(appdata, 'SlowJams')
+            elif xdg:  # Linux
+                self.config_dir = _join(xdg, 'slowjams')
+            elif os.path.exists(_join(_HOME, '.config')):  # Linux/Mac
+                self.config_dir = _join(_HOME, '.config/slowjams')
             else:  # Fallback
-                self.config_dir = os.path.expanduser('~/.slowjams')
+                self.config_dir = _join(_HOME, '.slowjams')
         else:
             self.config_dir = config_dir
         
         # Make sure the config directory exists
-        os.makedirs(self.config_dir, exist_ok=True)
+        self._ensure_dir(self.config_dir)
         
         # Set user configuration path
         if user_config_path is None:
-            self.user_config_path = os.path.join(self.config_dir, 'config.ini')
+            self.user_config_path = _join(self.config_dir, 'config.ini')
         else:
             self.user_config_path = user_config_path
         
         # Load configuration
         self.load_config()
     
+    def _ensure_dir(self, path: str):
+        """
+        Create a directory if needed, skipping the filesystem for known directories.
+        
+        Args:
+            path: Directory path.
+        """
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
     def load_config(self) -> bool:
         """
         Load configuration from default and user config files.
@@ -80,24 +236,41 @@ class ConfigLoader:
         Returns:
             True if successful, False otherwise.
         """
+        self._sync_config()
+        
         try:
-            # First, load the default configuration
-            if not os.path.exists(DEFAULT_CONFIG_PATH):
+            # Read both files up front, then parse them from memory
+            try:
+                default_text = _read_text(DEFAULT_CONFIG_PATH)
+            except FileNotFoundError:
                 logger.error(f"Default configuration file not found at {DEFAULT_CONFIG_PATH}")
                 return False
             
-            self.config.read(DEFAULT_CONFIG_PATH)
-            logger.info(f"Loaded default configuration from {DEFAULT_CONFIG_PATH}")
+            try:
+                user_text = _read_text(self.user_config_path)
+            except FileNotFoundError:
+                user_text = None
+            
+            log_info = logger.isEnabledFor(logging.INFO)
+            
+            # First, load the default configuration
+            self.config.read_string(default_text, source=DEFAULT_CONFIG_PATH)
+            if log_info:
+                logger.info(f"Loaded default configuration from {DEFAULT_CONFIG_PATH}")
             
             # Then, load user configuration if it exists
-            if os.path.exists(self.user_config_path):
-                self.config.read(self.user_config_path)
-                logger.info(f"Loaded user configuration from {self.user_config_path}")
-            else:
+            if user_text is not None:
+                self.config.read_string(user_text, source=self.user_config_path)
+                if log_info:
+                    logger.info(f"Loaded user configuration from {self.user_config_path}")
+            elif log_info:
                 logger.info(f"No user configuration found at {self.user_config_path}")
             
+            self._rebuild_flat()
+            
             # Apply any environment variable overrides
             self._apply_environment_overrides()
+            self._refresh_derived()
             
             return True
         
@@ -107,17 +280,84 @@ class ConfigLoader:
     
     def _apply_environment_overrides(self):
         """Apply environment variable overrides to configuration."""
-        # Loop through all sections and options
-        for section in self.config.sections():
-            for option in self.config.options(section):
-                # Create the environment variable name
-                env_var_name = f"SLOWJAMS_{section.upper()}_{option.upper()}"
+        # Only a handful of SLOWJAMS_* variables are normally set, so scan the
+        # environment once instead of probing it for every known option
+        overrides = {
+            key[len(_ENV_PREFIX):]: value
+            for key, value in os.environ.items()
+            if key.startswith(_ENV_PREFIX)
+        }
+        if not overrides:
+            return
+        
+        sections = [(section, section.upper() + '_') for section in self.config.sections()]
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        changed: Set[Tuple[str, str]] = set()
+        
+        for name, value in overrides.items():
+            for section, prefix in sections:
+                if not name.startswith(prefix):
+                    continue
                 
-                # Check if the environment variable exists
-                if env_var_name in os.environ:
+                option = sys.intern(name[len(prefix):].lower())
+                if self.config.has_option(section, option):
                     # Apply the override
-                    self.config.set(section, option, os.environ[env_var_name])
-                    logger.debug(f"Applied environment override: {env_var_name}")
+                    self.config.set(section, option, value)
+                    self._flat[(section, option)] = value
+                    changed.add((section, option))
+                    if log_debug:
+                        logger.debug(f"Applied environment override: {_ENV_PREFIX}{name}")
+                    break
+        
+        if changed:
+            self._invalidate(changed)
+    
+    def _invalidate(self, changed: Set[Tuple[str, str]]):
+        """
+        Drop cached converted values for the given options.
+        
+        Args:
+            changed: Set of (section, option) pairs whose values changed.
+        """
+        stale = [key for key in self._value_cache if key[1:3] in changed]
+        for key in stale:
+            del self._value_cache[key]
+    
+    def _rebuild_flat(self):
+        """Rebuild the flat (section, option) -> value mapping from the parser."""
+        # Interned keys let lookups with literal section/option names (which the
+        # compiler interns) match by identity instead of string comparison
+        intern = sys.intern
+        self._flat = {
+            (intern(section), intern(option)): value
+            for section in self.config.sections()
+            for option, value in self.config.items(section)
+        }
+        self._value_cache.clear()
+    
+    def _get_cached(self, typ: str, section: str, option: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Get a converted configuration value, converting it only on first access.
+        
+        Args:
+            typ: Name of the value type, used as part of the cache key.
+            section: Section name.
+            option: Option name.
+            parse: Converter applied to the raw string value, such as ``int``.
+            
+        Returns:
+            The converted value, or None if the option is missing or invalid.
+        """
+        key = (typ, section, option)
+        value = self._value_cache.get(key, _SENTINEL)
+        if value is _SENTINEL:
+            raw = self._flat.get((section, option))
+            try:
+                value = None if raw is None else parse(raw)
+            except ValueError:
+                value = None
+            self._value_cache[key] = value
+        return value
     
     def get_string(self, section: str, option: str, fallback: Optional[str] = None) -> Optional[str]:
         """
@@ -131,10 +371,7 @@ class ConfigLoader:
         Returns:
             The string value, or fallback if not found.
         """
-        try:
-            return self.config.get(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return fallback
+        return self._flat.get((section, option), fallback)
     
     def get_int(self, section: str, option: str, fallback: Optional[int] = None) -> Optional[int]:
         """
@@ -148,10 +385,8 @@ class ConfigLoader:
         Returns:
             The integer value, or fallback if not found or not an integer.
         """
-        try:
-            return self.config.getint(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        value = self._get_cached('int', section, option, int)
+        return fallback if value is None else value
     
     def get_float(self, section: str, option: str, fallback: Optional[float] = None) -> Optional[float]:
         """
@@ -165,10 +400,8 @@ class ConfigLoader:
         Returns:
             The float value, or fallback if not found or not a float.
         """
-        try:
-            return self.config.getfloat(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return fallback
+        value = self._get_cached('float', section, option, float)
+        return fallback if value is None else value
     
     def get_bool(self, section: str, option: str, fallback: Optional[bool] = None) -> Optional[bool]:
         """
@@ -182,10 +415,16 @@ class ConfigLoader:
         Returns:
             The boolean value, or fallback if not found or not a boolean.
         """
-        try:
-            return self.config.getboolean(section, option, fallback=fallback)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+        value = self._flat.get((section, option))
+        if value is None:
             return fallback
+        
+        value = value.lower()
+        if value in _TRUE:
+            return True
+        if value in _FALSE:
+            return False
+        return fallback
     
     def get_list(self, section: str, option: str, delimiter: str = ',', fallback: Optional[List[str]] = None) -> List[str]:
         """
@@ -200,15 +439,17 @@ class ConfigLoader:
         Returns:
             The list value, or fallback if not found.
         """
-        try:
-            value = self.config.get(section, option)
-            if not value:
-                return fallback if fallback is not None else []
-            
-            return [item.strip() for item in value.split(delimiter)]
+        key = ('list', section, option, delimiter)
+        items = self._value_cache.get(key, _SENTINEL)
+        if items is _SENTINEL:
+            value = self._flat.get((section, option))
+            items = tuple(item.strip() for item in value.split(delimiter)) if value else None
+            self._value_cache[key] = items
         
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        if items is None:
             return fallback if fallback is not None else []
+        
+        return list(items)
     
     def get_path(self, section: str, option: str, fallback: Optional[str] = None) -> Optional[Path]:
         """
@@ -222,16 +463,18 @@ class ConfigLoader:
         Returns:
             The path value as a Path object, or fallback if not found.
         """
-        try:
-            value = self.config.get(section, option, fallback=fallback)
-            if not value:
-                return Path(fallback) if fallback is not None else None
-            
+        key = ('path', section, option)
+        path = self._value_cache.get(key, _SENTINEL)
+        if path is _SENTINEL:
+            value = self._flat.get((section, option))
             # Expand user directory (~/...)
-            return Path(os.path.expanduser(value))
+            path = Path(_expand(value)) if value else None
+            self._value_cache[key] = path
         
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        if path is None:
             return Path(fallback) if fallback is not None else None
+        
+        return path
     
     def get_all_options(self, section: str) -> Dict[str, str]:
         """
@@ -243,10 +486,12 @@ class ConfigLoader:
         Returns:
             A dictionary of all options in the section.
         """
-        try:
-            return dict(self.config.items(section))
-        except configparser.NoSectionError:
+        self._sync_config()
+        
+        if not self.config.has_section(section):
             return {}
+        
+        return dict(self.config.items(section))
     
     def get_all_sections(self) -> List[str]:
         """
@@ -255,8 +500,22 @@ class ConfigLoader:
         Returns:
             A list of all section names.
         """
+        self._sync_config()
+        
         return self.config.sections()
     
+    def _sync_config(self):
+        """Mirror values changed through set_value into the config parser."""
+        if not self._dirty:
+            return
+        
+        for section, option in self._dirty:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            self.config.set(section, option, self._flat[(section, option)])
+        
+        self._dirty.clear()
+    
     def save_user_config(self) -> bool:
         """
         Save the current configuration to the user config file.
@@ -265,10 +524,22 @@ class ConfigLoader:
             True if successful, False otherwise.
         """
         try:
-            os.makedirs(os.path.dirname(self.user_config_path), exist_ok=True)
+            self._ensure_dir(os.path.dirname(self.user_config_path))
+            
+            # Group the flat values by section, keeping first-seen order
+            sections: Dict[str, List[str]] = {}
+            for (section, option), value in self._flat.items():
+                lines = sections.get(section)
+                if lines is None:
+                    lines = sections[section] = [f"[{section}]\n"]
+                # Same layout as ConfigParser.write, including continuation lines
+                value = value.replace('\n', '\n\t')
+                lines.append(f"{option} = {value}\n")
             
             with open(self.user_config_path, 'w') as f:
-                self.config.write(f)
+                for lines in sections.values():
+                    f.writelines(lines)
+                    f.write('\n')
             
             logger.info(f"Saved user configuration to {self.user_config_path}")
             return True
@@ -290,10 +561,6 @@ class ConfigLoader:
             True if successful, False otherwise.
         """
         try:
-            # Ensure the section exists
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            
             # Convert the value to string
             if value is None:
                 str_value = ''
@@ -304,8 +571,14 @@ class ConfigLoader:
             else:
                 str_value = str(value)
             
-            # Set the value
-            self.config.set(section, option, str_value)
+            # Set the value; the parser is only updated when it is next needed
+            key = (sys.intern(section), sys.intern(self.config.optionxform(option)))
+            self._flat[key] = str_value
+            self._dirty.add(key)
+            self._invalidate({key})
+            
+            if key in _DERIVED_OPTIONS:
+                self._refresh_derived()
             return True
         
         except Exception as e:
@@ -331,10 +604,11 @@ class ConfigLoader:
         Returns:
             True if successful, False otherwise.
         """
+        self._sync_config()
+        
         try:
-            # Create a new config parser for default values
-            default_config = configparser.ConfigParser()
-            default_config.read(DEFAULT_CONFIG_PATH)
+            # Shared parsed defaults; values are copied out, never modified in place
+            default_config = _load_default()
             
             if section is not None:
                 # Reset a specific section
@@ -362,12 +636,34 @@ class ConfigLoader:
                     for option, value in default_config.items(default_section):
                         self.config.set(default_section, option, value)
             
+            self._rebuild_flat()
+            self._refresh_derived()
             return True
         
         except Exception as e:
             logger.error(f"Error resetting configuration: {str(e)}")
             return False
     
+    def _refresh_derived(self):
+        """Recompute the attributes derived from frequently read options."""
+        self.simulation_mode = self.get_bool('Advanced', 'simulation_mode', fallback=False)
+        
+        download_dir = self._flat.get(('General', 'download_directory'))
+        if not download_dir:
+            # Use the system's default Downloads directory (same layout on all platforms)
+            download_dir = os.path.join(_HOME, 'Downloads')
+        
+        self._download_dir = download_dir
+        self.download_directory = Path(download_dir)
+        
+        temp_dir = self._flat.get(('General', 'temp_directory'))
+        if not temp_dir:
+            # Use the system's default temp directory
+            temp_dir = os.path.join(tempfile.gettempdir(), 'slowjams')
+        
+        self._temp_dir = temp_dir
+        self._temp_dir_path = Path(temp_dir)
+    
     def get_download_directory(self) -> Path:
         """
         Get the download directory.
@@ -375,19 +671,21 @@ class ConfigLoader:
         Returns:
             The download directory as a Path object.
         """
-        download_dir = self.get_string('General', 'download_directory')
+        # Ensure the directory exists
+        self._ensure_dir(self._download_dir)
         
-        if not download_dir:
-            # Use the system's default Downloads directory
-            if os.name == 'nt':  # Windows
-                download_dir = os.path.join(os.path.expanduser('~'), 'Downloads')
-            else:  # Linux/Mac
-                download_dir = os.path.join(os.path.expanduser('~'), 'Downloads')
+        return self.download_directory
+    
+    def get_download_directory_str(self) -> str:
+        """
+        Get the download directory as a plain string.
         
-        # Ensure the directory exists
-        os.makedirs(download_dir, exist_ok=True)
+        Returns:
+            The download directory path.
+        """
+        self._ensure_dir(self._download_dir)
         
-        return Path(download_dir)
+        return self._download_dir
     
     def get_temp_directory(self) -> Path:
         """
@@ -396,17 +694,21 @@ class ConfigLoader:
         Returns:
             The temporary directory as a Path object.
         """
-        temp_dir = self.get_string('General', 'temp_directory')
+        # Ensure the directory exists
+        self._ensure_dir(self._temp_dir)
         
-        if not temp_dir:
-            # Use the system's default temp directory
-            import tempfile
-            temp_dir = os.path.join(tempfile.gettempdir(), 'slowjams')
+        return self._temp_dir_path
+    
+    def get_temp_directory_str(self) -> str:
+        """
+        Get the temporary directory as a plain string.
         
-        # Ensure the directory exists
-        os.makedirs(temp_dir, exist_ok=True)
+        Returns:
+            The temporary directory path.
+        """
+        self._ensure_dir(self._temp_dir)
         
-        return Path(temp_dir)
+        return self._temp_dir
     
     def is_simulation_mode(self) -> bool:
         """
@@ -415,17 +717,40 @@ class ConfigLoader:
         Returns:
             True if simulation mode is enabled, False otherwise.
         """
-        return self.get_bool('Advanced', 'simulation_mode', fallback=False)
+        return self.simulation_mode
 
 
 # Singleton instance
-_config_instance = None
+_config_instance: Optional[ConfigLoader] = None
+_config_lock = threading.Lock()
+
+
+def _create_config(config_dir: Optional[str], user_config_path: Optional[str]) -> ConfigLoader:
+    """
+    Create the configuration loader instance exactly once, even if several
+    threads request it concurrently during startup.
+    
+    Args:
+        config_dir: Optional directory for configuration files.
+        user_config_path: Optional path to user configuration file.
+        
+    Returns:
+        The configuration loader instance.
+    """
+    global _config_instance
+    
+    with _config_lock:
+        if _config_instance is None:
+            _config_instance = ConfigLoader(config_dir, user_config_path)
+        return _config_instance
 
 
 def get_config(config_dir: Optional[str] = None, user_config_path: Optional[str] = None) -> ConfigLoader:
     """
     Get the configuration loader instance.
     
+    The arguments are only used when the instance is first created.
+    
     Args:
         config_dir: Optional directory for configuration files.
         user_config_path: Optional path to user configuration file.
@@ -433,12 +758,15 @@ def get_config(config_dir: Optional[str] = None, user_config_path: Optional[str]
     Returns:
         The configuration loader instance.
     """
-    global _config_instance
+    instance = _config_instance
+    if instance is None:
+        return _create_config(config_dir, user_config_path)
     
-    if _config_instance is None:
-        _config_instance = ConfigLoader(config_dir, user_config_path)
+    if ((config_dir is not None and config_dir != instance.config_dir) or
+            (user_config_path is not None and user_config_path != instance.user_config_path)):
+        logger.warning("Configuration already loaded; ignoring config_dir/user_config_path arguments")
     
-    return _config_instance
+    return instance
 
 
 if __name__ == "__main__":
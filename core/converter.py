@@ -6,14 +6,19 @@ between different audio formats with configurable quality settings.
 """
 
 import os
+import re
+import asyncio
+import functools
 import subprocess
 import logging
 import tempfile
+import shutil
 import json
-from typing import Optional, Dict, Any, Callable, Tuple, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Callable, Tuple, List, Sequence, Union, BinaryIO
 from pathlib import Path
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 # Import the custom utilities
 try:
@@ -24,6 +29,26 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from utils.env_loader import get_bool_env
 
+# Use orjson for ffprobe output when available; it parses several times faster
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# msgspec decodes ffprobe output straight into typed structs when available
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# mutagen can rewrite tags in place without touching the audio
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,32 +63,35 @@ class AudioFormat(Enum):
     @classmethod
     def from_string(cls, format_str: str) -> 'AudioFormat':
         """Convert a string to an AudioFormat enum value."""
-        format_map = {
-            "mp3": cls.MP3,
-            "wav": cls.WAV,
-            "flac": cls.FLAC,
-            "aac": cls.AAC,
-            "m4a": cls.AAC,  # Treat m4a as AAC
-            "ogg": cls.OGG
-        }
-        
-        format_str = format_str.lower().strip()
-        if format_str not in format_map:
-            raise ValueError(f"Unsupported audio format: {format_str}")
-        
-        return format_map[format_str]
+        key = format_str.strip().casefold()
+        try:
+            return _FORMAT_FROM_STRING[key]
+        except KeyError:
+            raise ValueError(f"Unsupported audio format: {key}")
     
     @property
     def extension(self) -> str:
         """Get the file extension for the format."""
-        extensions = {
-            AudioFormat.MP3: "mp3",
-            AudioFormat.WAV: "wav",
-            AudioFormat.FLAC: "flac",
-            AudioFormat.AAC: "m4a",
-            AudioFormat.OGG: "ogg"
-        }
-        return extensions[self]
+        return _FORMAT_EXTENSIONS[self]
+
+
+# Lookup tables for AudioFormat; kept outside the class so they don't become members
+_FORMAT_FROM_STRING: Dict[str, AudioFormat] = {
+    "mp3": AudioFormat.MP3,
+    "wav": AudioFormat.WAV,
+    "flac": AudioFormat.FLAC,
+    "aac": AudioFormat.AAC,
+    "m4a": AudioFormat.AAC,  # Treat m4a as AAC
+    "ogg": AudioFormat.OGG
+}
+
+_FORMAT_EXTENSIONS: Dict[AudioFormat, str] = {
+    AudioFormat.MP3: "mp3",
+    AudioFormat.WAV: "wav",
+    AudioFormat.FLAC: "flac",
+    AudioFormat.AAC: "m4a",
+    AudioFormat.OGG: "ogg"
+}
 
 
 @dataclass
@@ -75,6 +103,7 @@ class ConversionOptions:
     sample_rate: int = 44100  # Hz
     channels: int = 2  # Stereo
     normalize: bool = False  # Whether to normalize audio levels
+    normalize_mode: str = "loudnorm"  # "loudnorm" (EBU R128) or "peak" (cheaper gain-only)
     start_time: Optional[float] = None  # Start time in seconds
     end_time: Optional[float] = None  # End time in seconds
     metadata: Optional[Dict[str, str]] = None  # Metadata to embed
@@ -104,6 +133,41 @@ class ConversionOptions:
         )
 
 
+# Codec arguments for each output format
+_FORMAT_ARGS: Dict[AudioFormat, Callable[[ConversionOptions], List[str]]] = {
+    AudioFormat.MP3: lambda o: ["-c:a", "libmp3lame", "-b:a", o.bitrate],
+    AudioFormat.FLAC: lambda o: ["-c:a", "flac"],
+    AudioFormat.WAV: lambda o: ["-c:a", "pcm_s16le"],
+    AudioFormat.AAC: lambda o: ["-c:a", "aac", "-b:a", o.bitrate],
+    AudioFormat.OGG: lambda o: ["-c:a", "libvorbis", "-b:a", o.bitrate],
+}
+
+# Codec FFmpeg reports for audio already encoded the way each format would write it
+_FORMAT_CODECS: Dict[AudioFormat, str] = {
+    AudioFormat.MP3: "mp3",
+    AudioFormat.FLAC: "flac",
+    AudioFormat.WAV: "pcm_s16le",
+    AudioFormat.AAC: "aac",
+    AudioFormat.OGG: "vorbis",
+}
+
+_LOSSLESS_FORMATS = frozenset((AudioFormat.FLAC, AudioFormat.WAV))
+
+# Keep FFmpeg's stderr down to actual errors
+_QUIET_ARGS = ("-hide_banner", "-loglevel", "error", "-nostats")
+_NO_VIDEO_ARGS = ("-vn",)
+
+# Record of the -progress stream that carries the encoded position
+_OUT_TIME_KEY = b"out_time_us="
+# Single-pass loudnorm; a measuring first pass would double the decode cost
+_NORMALIZE_ARGS = ("-af", "loudnorm=I=-16:LRA=11:TP=-1.5")
+
+# Peak normalization scans the input once, then applies a constant gain
+_NORMALIZE_MODES = frozenset(("loudnorm", "peak"))
+_PEAK_TARGET_DB = -1.0
+_MAX_VOLUME_RE = re.compile(rb"max_volume: (-?[\d.]+) dB")
+
+
 @dataclass
 class AudioMetadata:
     """Audio file metadata."""
@@ -119,6 +183,7 @@ class AudioMetadata:
     sample_rate: Optional[int] = None
     channels: Optional[int] = None
     bitrate: Optional[int] = None  # Bitrate in kbps
+    codec: Optional[str] = None  # FFmpeg codec name of the audio stream
     
     def to_ffmpeg_metadata(self) -> Dict[str, str]:
         """Convert to FFmpeg metadata format."""
@@ -163,6 +228,7 @@ class AudioMetadata:
             # Extract technical details from audio stream
             sample_rate = int(audio_stream.get("sample_rate", 0))
             channels = int(audio_stream.get("channels", 0))
+            codec = audio_stream.get("codec_name")
             
             # Extract metadata
             tags = {}
@@ -196,12 +262,127 @@ class AudioMetadata:
                 duration=duration,
                 sample_rate=sample_rate,
                 channels=channels,
-                bitrate=bitrate
+                bitrate=bitrate,
+                codec=codec
             )
             
         except Exception as e:
             logger.error(f"Error extracting metadata from ffprobe data: {str(e)}")
             return cls()
+    
+    @classmethod
+    def from_probe_result(cls, result: '_ProbeResult') -> 'AudioMetadata':
+        """Create AudioMetadata from ffprobe output decoded by msgspec."""
+        format_data = result.format
+        duration = format_data.duration
+        bitrate = format_data.bit_rate // 1000  # Convert to kbps
+        
+        # Find the audio stream
+        audio_stream = next(
+            (stream for stream in result.streams if stream.codec_type == "audio"), None
+        )
+        if not audio_stream:
+            return cls(duration=duration, bitrate=bitrate)
+        
+        # Stream tags override format tags, matched case-insensitively
+        tags = {k.lower(): v for k, v in format_data.tags.items()}
+        tags.update((k.lower(), v) for k, v in audio_stream.tags.items())
+        
+        return cls(
+            title=tags.get("title"),
+            artist=tags.get("artist") or tags.get("album_artist"),
+            album=tags.get("album"),
+            year=tags.get("date") or tags.get("year"),
+            track=tags.get("track"),
+            genre=tags.get("genre"),
+            comment=tags.get("comment"),
+            duration=duration,
+            sample_rate=audio_stream.sample_rate,
+            channels=audio_stream.channels,
+            bitrate=bitrate,
+            codec=audio_stream.codec_name
+        )
+
+
+if MSGSPEC_AVAILABLE:
+    class _ProbeFormat(msgspec.Struct):
+        """The ``format`` section of ffprobe's JSON output."""
+        duration: float = 0.0
+        bit_rate: int = 0
+        tags: Dict[str, str] = {}
+    
+    class _ProbeStream(msgspec.Struct):
+        """One entry of the ``streams`` section of ffprobe's JSON output."""
+        codec_type: str = ""
+        codec_name: Optional[str] = None
+        sample_rate: int = 0
+        channels: int = 0
+        tags: Dict[str, str] = {}
+    
+    class _ProbeResult(msgspec.Struct):
+        """ffprobe's JSON output for ``-show_format -show_streams``."""
+        format: _ProbeFormat = msgspec.field(default_factory=_ProbeFormat)
+        streams: List[_ProbeStream] = []
+    
+    # ffprobe reports numbers as strings, so allow lax conversion
+    _PROBE_DECODER = msgspec.json.Decoder(_ProbeResult, strict=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_raw(cmd: Tuple[str, ...], mtime_ns: int, size: int) -> str:
+    """
+    Run an ffprobe command and return its JSON output.
+    
+    Results are cached; the file's modification time and size are part of
+    the key so edited files are probed again.
+    
+    Args:
+        cmd: Complete ffprobe command, including the file path.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+        
+    Returns:
+        The ffprobe output.
+        
+    Raises:
+        subprocess.CalledProcessError: If ffprobe fails.
+    """
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration(cmd: Tuple[str, ...], mtime_ns: int, size: int) -> float:
+    """
+    Run an ffprobe duration query and return the duration in seconds.
+    
+    Args:
+        cmd: Complete ffprobe command, including the file path.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+        
+    Returns:
+        Duration in seconds, or 0 if ffprobe reports none.
+    """
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    value = result.stdout.strip()
+    return float(value) if value and value != "N/A" else 0.0
+
+
+def _error_message(error: subprocess.CalledProcessError) -> str:
+    """
+    Get a readable message from a failed FFmpeg or FFprobe run.
+    
+    Args:
+        error: The error raised by subprocess.
+        
+    Returns:
+        The process's stderr output, or a description of the error if there was none.
+    """
+    stderr = error.stderr
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode("utf-8", "replace")
+    return stderr.strip() if stderr else str(error)
 
 
 class AudioConverter:
@@ -212,7 +393,8 @@ class AudioConverter:
     
     def __init__(self, ffmpeg_path: Optional[str] = None, 
                  ffprobe_path: Optional[str] = None,
-                 temp_dir: Optional[str] = None):
+                 temp_dir: Optional[str] = None,
+                 ffmpeg_threads: Optional[int] = None):
         """
         Initialize the audio converter.
         
@@ -220,10 +402,13 @@ class AudioConverter:
             ffmpeg_path: Path to the FFmpeg executable. If None, assumes it's in PATH.
             ffprobe_path: Path to the FFprobe executable. If None, assumes it's in PATH.
             temp_dir: Directory for temporary files. If None, uses system temp dir.
+            ffmpeg_threads: Threads each FFmpeg process may use. If None, FFmpeg decides.
         """
-        self.ffmpeg_path = ffmpeg_path or "ffmpeg"
-        self.ffprobe_path = ffprobe_path or "ffprobe"
+        # Resolve the executables once instead of searching PATH on every spawn
+        self.ffmpeg_path = shutil.which(ffmpeg_path or "ffmpeg") or ffmpeg_path or "ffmpeg"
+        self.ffprobe_path = shutil.which(ffprobe_path or "ffprobe") or ffprobe_path or "ffprobe"
         self.temp_dir = temp_dir or tempfile.gettempdir()
+        self.ffmpeg_threads = ffmpeg_threads or 0
         self.simulation_mode = get_bool_env("SIMULATION_MODE", False)
         
     def extract_audio(self, video_path: str, output_path: Optional[str] = None,
@@ -245,58 +430,23 @@ class AudioConverter:
             ValueError: If the video file doesn't exist or the extraction fails.
             FileNotFoundError: If FFmpeg is not found.
         """
-        if not os.path.exists(video_path):
+        source = Path(video_path)
+        try:
+            source.stat()
+        except FileNotFoundError:
             raise ValueError(f"Video file not found: {video_path}")
         
         options = options or ConversionOptions.default_options()
         
         # Generate output path if not provided
         if not output_path:
-            video_name = os.path.splitext(os.path.basename(video_path))[0]
             output_path = os.path.join(
                 self.temp_dir, 
-                f"{video_name}.{options.format.extension}"
+                f"{source.stem}.{options.format.extension}"
             )
         
         # Build FFmpeg command
-        cmd = [self.ffmpeg_path, "-y", "-i", video_path]
-        
-        # Add time range if specified
-        if options.start_time is not None:
-            cmd.extend(["-ss", str(options.start_time)])
-        if options.end_time is not None:
-            cmd.extend(["-to", str(options.end_time)])
-        
-        # Add audio options
-        cmd.extend([
-            "-vn",  # No video
-            "-ar", str(options.sample_rate),
-            "-ac", str(options.channels),
-        ])
-        
-        # Format-specific options
-        if options.format == AudioFormat.MP3:
-            cmd.extend(["-c:a", "libmp3lame", "-b:a", options.bitrate])
-        elif options.format == AudioFormat.FLAC:
-            cmd.extend(["-c:a", "flac"])
-        elif options.format == AudioFormat.WAV:
-            cmd.extend(["-c:a", "pcm_s16le"])
-        elif options.format == AudioFormat.AAC:
-            cmd.extend(["-c:a", "aac", "-b:a", options.bitrate])
-        elif options.format == AudioFormat.OGG:
-            cmd.extend(["-c:a", "libvorbis", "-b:a", options.bitrate])
-        
-        # Normalization if requested
-        if options.normalize:
-            cmd.extend(["-af", "loudnorm=I=-16:LRA=11:TP=-1.5"])
-        
-        # Add metadata if provided
-        if options.metadata:
-            for key, value in options.metadata.items():
-                cmd.extend(["-metadata", f"{key}={value}"])
-        
-        # Output file
-        cmd.append(output_path)
+        cmd = self._build_cmd(video_path, output_path, options, drop_video=True)
         
         if self.simulation_mode:
             logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
@@ -311,38 +461,15 @@ class AudioConverter:
                 duration = self._get_duration(video_path)
                 
                 # Run with progress monitoring
-                process = subprocess.Popen(
-                    cmd, 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True
-                )
-                
-                for line in iter(process.stdout.readline, ""):
-                    # Parse time information from FFmpeg output
-                    if "time=" in line:
-                        time_str = line.split("time=")[1].split(" ")[0].strip()
-                        try:
-                            # Convert HH:MM:SS.MS to seconds
-                            h, m, s = time_str.split(":")
-                            current_time = float(h) * 3600 + float(m) * 60 + float(s)
-                            if duration > 0:
-                                progress = min(100.0, (current_time / duration) * 100.0)
-                                progress_callback(progress)
-                        except (ValueError, IndexError):
-                            pass
-                
-                process.wait()
-                if process.returncode != 0:
-                    raise subprocess.CalledProcessError(process.returncode, cmd)
+                self._run_with_progress(cmd, duration, progress_callback)
             else:
                 # Run without progress monitoring
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
+                self._run_quiet(cmd)
                 
             return output_path
             
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if hasattr(e, 'stderr') and e.stderr else str(e)
+            error_msg = _error_message(e)
             logger.error(f"FFmpeg error during audio extraction: {error_msg}")
             raise ValueError(f"Failed to extract audio: {error_msg}")
         except FileNotFoundError:
@@ -352,14 +479,16 @@ class AudioConverter:
             logger.error(f"Unexpected error during audio extraction: {str(e)}")
             raise
     
-    def convert_audio(self, input_path: str, output_path: Optional[str] = None,
+    def convert_audio(self, input_path: Union[str, bytes, BinaryIO],
+                     output_path: Optional[str] = None,
                      options: Optional[ConversionOptions] = None,
                      progress_callback: Optional[Callable[[float], None]] = None) -> str:
         """
         Convert an audio file to a different format or quality.
         
         Args:
-            input_path: Path to the input audio file.
+            input_path: Path to the input audio file, or the audio itself as bytes
+                or a binary file object, which is piped to FFmpeg's stdin.
             output_path: Path for the output audio file. If None, generates one.
             options: Conversion options. If None, uses defaults.
             progress_callback: Optional callback for progress updates.
@@ -371,67 +500,59 @@ class AudioConverter:
             ValueError: If the input file doesn't exist or the conversion fails.
             FileNotFoundError: If FFmpeg is not found.
         """
-        if not os.path.exists(input_path):
+        if not isinstance(input_path, (str, os.PathLike)):
+            return self._convert_stream(input_path, output_path, options, progress_callback)
+        
+        source = Path(input_path)
+        try:
+            st = source.stat()
+        except FileNotFoundError:
             raise ValueError(f"Input audio file not found: {input_path}")
         
         options = options or ConversionOptions.default_options()
         
         # Generate output path if not provided
         if not output_path:
-            input_name = os.path.splitext(os.path.basename(input_path))[0]
             output_path = os.path.join(
                 self.temp_dir, 
-                f"{input_name}.{options.format.extension}"
+                f"{source.stem}.{options.format.extension}"
             )
         
-        # Read original metadata if available and none provided in options
+        # Read original metadata, used for its tags if none are provided in options
+        tags_given = bool(options.metadata)
         original_metadata = None
-        if not options.metadata:
-            try:
-                original_metadata = self.get_metadata(input_path)
-                if original_metadata:
-                    options.metadata = original_metadata.to_ffmpeg_metadata()
-            except Exception as e:
-                logger.warning(f"Failed to read original metadata: {str(e)}")
-        
-        # Build FFmpeg command
-        cmd = [self.ffmpeg_path, "-y", "-i", input_path]
-        
-        # Add time range if specified
-        if options.start_time is not None:
-            cmd.extend(["-ss", str(options.start_time)])
-        if options.end_time is not None:
-            cmd.extend(["-to", str(options.end_time)])
-        
-        # Add audio options
-        cmd.extend([
-            "-ar", str(options.sample_rate),
-            "-ac", str(options.channels),
-        ])
-        
-        # Format-specific options
-        if options.format == AudioFormat.MP3:
-            cmd.extend(["-c:a", "libmp3lame", "-b:a", options.bitrate])
-        elif options.format == AudioFormat.FLAC:
-            cmd.extend(["-c:a", "flac"])
-        elif options.format == AudioFormat.WAV:
-            cmd.extend(["-c:a", "pcm_s16le"])
-        elif options.format == AudioFormat.AAC:
-            cmd.extend(["-c:a", "aac", "-b:a", options.bitrate])
-        elif options.format == AudioFormat.OGG:
-            cmd.extend(["-c:a", "libvorbis", "-b:a", options.bitrate])
+        try:
+            original_metadata = self._probe_metadata(input_path, st)
+            if original_metadata and not tags_given:
+                options.metadata = original_metadata.to_ffmpeg_metadata()
+        except Exception as e:
+            logger.warning(f"Failed to read original metadata: {str(e)}")
         
-        # Normalization if requested
-        if options.normalize:
-            cmd.extend(["-af", "loudnorm=I=-16:LRA=11:TP=-1.5"])
+        # Skip re-encoding when the input already matches the requested output
+        copy_mode = self._copy_mode(source, options, original_metadata)
+        if copy_mode == "file" and not self.simulation_mode:
+            if not tags_given:
+                return self._copy_input(input_path, output_path)
+            if self._copy_with_tags(input_path, output_path, options.metadata):
+                return output_path
+            copy_mode = "stream"
         
-        # Add metadata if provided
-        if options.metadata:
-            for key, value in options.metadata.items():
-                cmd.extend(["-metadata", f"{key}={value}"])
+        # An output hard-linked to the input would truncate the input as FFmpeg
+        # writes it, so unlink it first
+        if os.path.abspath(input_path) != os.path.abspath(output_path):
+            try:
+                if os.path.samefile(input_path, output_path):
+                    os.remove(output_path)
+            except OSError:
+                pass
         
-        # Output file
-        cmd.append(output_path)
+        # Build FFmpeg command
+        if copy_mode:
+            # The audio is already right, so copy the stream as-is
+            cmd = [self.ffmpeg_path, "-y", *_QUIET_ARGS, "-i", input_path,
+                   "-vn", "-c:a", "copy", *self._metadata_args(options), output_path]
+        else:
+            cmd = self._build_cmd(input_path, output_path, options)
         
         if self.simulation_mode:
             logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
@@ -443,41 +564,93 @@ class AudioConverter:
         try:
             if progress_callback:
                 # Get audio duration for progress calculation
-                duration = self._get_duration(input_path)
+                if original_metadata and original_metadata.duration:
+                    duration = original_metadata.duration
+                else:
+                    duration = self._get_duration(input_path)
                 
                 # Run with progress monitoring
-                process = subprocess.Popen(
-                    cmd, 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True
-                )
-                
-                for line in iter(process.stdout.readline, ""):
-                    # Parse time information from FFmpeg output
-                    if "time=" in line:
-                        time_str = line.split("time=")[1].split(" ")[0].strip()
-                        try:
-                            # Convert HH:MM:SS.MS to seconds
-                            h, m, s = time_str.split(":")
-                            current_time = float(h) * 3600 + float(m) * 60 + float(s)
-                            if duration > 0:
-                                progress = min(100.0, (current_time / duration) * 100.0)
-                                progress_callback(progress)
-                        except (ValueError, IndexError):
-                            pass
-                
-                process.wait()
-                if process.returncode != 0:
-                    raise subprocess.CalledProcessError(process.returncode, cmd)
+                self._run_with_progress(cmd, duration, progress_callback)
             else:
                 # Run without progress monitoring
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
+                self._run_quiet(cmd)
                 
             return output_path
             
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if hasattr(e, 'stderr') and e.stderr else str(e)
+            error_msg = _error_message(e)
+            logger.error(f"FFmpeg error during audio conversion: {error_msg}")
+            raise ValueError(f"Failed to convert audio: {error_msg}")
+        except FileNotFoundError:
+            logger.error(f"FFmpeg not found at {self.ffmpeg_path}")
+            raise FileNotFoundError(f"FFmpeg not found at {self.ffmpeg_path}")
+        except Exception as e:
+            logger.error(f"Unexpected error during audio conversion: {str(e)}")
+            raise
+    
+    def _convert_stream(self, data: Union[bytes, BinaryIO], output_path: Optional[str],
+                        options: Optional[ConversionOptions],
+                        progress_callback: Optional[Callable[[float], None]]) -> str:
+        """
+        Convert in-memory audio by piping it to FFmpeg's stdin.
+        
+        Args:
+            data: Audio data as bytes or a binary file object.
+            output_path: Path for the output audio file. If None, generates one.
+            options: Conversion options. If None, uses defaults.
+            progress_callback: Optional callback, called once the conversion is done
+                since the input's duration isn't known up front.
+            
+        Returns:
+            Path to the converted audio file.
+            
+        Raises:
+            ValueError: If the options need a file input or the conversion fails.
+            FileNotFoundError: If FFmpeg is not found.
+        """
+        options = options or ConversionOptions.default_options()
+        if options.normalize and options.normalize_mode == "peak":
+            raise ValueError("Peak normalization needs a file input")
+        
+        if not output_path:
+            fd, output_path = tempfile.mkstemp(
+                suffix=f".{options.format.extension}", dir=self.temp_dir
+            )
+            os.close(fd)
+        
+        cmd = self._build_cmd("pipe:0", output_path, options)
+        
+        if self.simulation_mode:
+            logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
+            # Create a small dummy audio file in simulation mode
+            with open(output_path, "wb") as f:
+                f.write(b"\0" * 1024)  # 1KB dummy file
+            return output_path
+        
+        # Hand FFmpeg real files directly and give it views of in-memory buffers
+        stdin = buffer = None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            payload = data
+        elif hasattr(data, "getbuffer"):
+            # Only what's left from the current position, as read() would give
+            buffer = data.getbuffer()
+            payload = buffer[data.tell():]
+        else:
+            try:
+                data.fileno()
+                stdin, payload = data, None
+            except (AttributeError, OSError, ValueError):
+                payload = data.read()
+        
+        try:
+            subprocess.run(cmd, input=payload, stdin=stdin, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            if progress_callback:
+                progress_callback(100.0)
+            return output_path
+            
+        except subprocess.CalledProcessError as e:
+            error_msg = _error_message(e)
             logger.error(f"FFmpeg error during audio conversion: {error_msg}")
             raise ValueError(f"Failed to convert audio: {error_msg}")
         except FileNotFoundError:
@@ -486,13 +659,470 @@ class AudioConverter:
         except Exception as e:
             logger.error(f"Unexpected error during audio conversion: {str(e)}")
             raise
+        finally:
+            # An exported view would keep the BytesIO from being resized or closed
+            if buffer is not None:
+                payload.release()
+                buffer.release()
+    
+    def _copy_mode(self, source: Path, options: ConversionOptions,
+                   metadata: Optional[AudioMetadata]) -> Optional[str]:
+        """
+        Decide whether a conversion can skip re-encoding.
+        
+        Args:
+            source: Path to the input audio file.
+            options: Conversion options.
+            metadata: Metadata probed from the input, if available.
+            
+        Returns:
+            "file" if the input can be used as the output unchanged, "stream" if
+            only the container needs to change, or None if FFmpeg must re-encode.
+        """
+        if (metadata is None or options.normalize or options.start_time is not None
+                or options.end_time is not None):
+            return None
+        if (metadata.codec != _FORMAT_CODECS[options.format]
+                or metadata.sample_rate != options.sample_rate
+                or metadata.channels != options.channels):
+            return None
+        if (options.format not in _LOSSLESS_FORMATS
+                and f"{metadata.bitrate}k" != options.bitrate):
+            return None
+        
+        try:
+            same_container = AudioFormat.from_string(source.suffix[1:]) == options.format
+        except ValueError:
+            same_container = False
+        
+        return "file" if same_container else "stream"
+    
+    def _copy_input(self, input_path: str, output_path: str) -> str:
+        """
+        Place a copy of an input file at the output path without re-encoding it.
+        
+        The output is always a separate file, never a hard link, so later writes
+        to the output can't reach the input.
+        
+        Args:
+            input_path: Path to the input audio file.
+            output_path: Path for the output audio file.
+            
+        Returns:
+            Path to the output audio file.
+        """
+        if os.path.abspath(input_path) == os.path.abspath(output_path):
+            return output_path
+        
+        # Replace rather than overwrite, in case the output is linked to the input
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        shutil.copyfile(input_path, output_path)
+        
+        logger.debug(f"Input already matches output format, copied {input_path} to {output_path}")
+        return output_path
+    
+    def _copy_with_tags(self, input_path: str, output_path: str,
+                        metadata: Dict[str, str]) -> bool:
+        """
+        Copy an input file to the output path and rewrite its tags with mutagen.
+        
+        Args:
+            input_path: Path to the input audio file.
+            output_path: Path for the output audio file.
+            metadata: Tags to write, using FFmpeg tag names.
+            
+        Returns:
+            True if the tags were written, False if FFmpeg has to be used instead.
+        """
+        if not MUTAGEN_AVAILABLE:
+            return False
+        
+        # mutagen's easy interface calls the track number "tracknumber"
+        tags = {("tracknumber" if key == "track" else key): str(value)
+                for key, value in metadata.items()}
+        
+        try:
+            audio = mutagen.File(input_path, easy=True)
+            if audio is None:
+                return False
+            
+            # Check the tags before copying, so a tag the easy interface can't
+            # write (e.g. an MP3 "comment") leaves the output to FFmpeg
+            if audio.tags is None:
+                audio.add_tags()
+            valid_keys = getattr(audio.tags, "valid_keys", None)
+            if valid_keys is not None and any(key not in valid_keys for key in tags):
+                return False
+            
+            if os.path.abspath(input_path) != os.path.abspath(output_path):
+                self._copy_input(input_path, output_path)
+            
+            audio = mutagen.File(output_path, easy=True)
+            if audio is None:
+                return False
+            
+            for key, value in tags.items():
+                audio[key] = value
+            audio.save()
+            
+            logger.debug(f"Only tags changed, rewrote tags of {output_path} in place")
+            return True
+            
+        except Exception as e:
+            logger.debug(f"mutagen couldn't write tags to {output_path}: {str(e)}")
+            return False
+    
+    def batch_convert(self, inputs: Sequence[str],
+                      outputs: Optional[Sequence[Optional[str]]] = None,
+                      options: Optional[ConversionOptions] = None,
+                      jobs: Optional[int] = None,
+                      progress_callback: Optional[Callable[[float], None]] = None) -> List[str]:
+        """
+        Convert several audio files in parallel, one FFmpeg process per file.
+        
+        Args:
+            inputs: Paths to the input audio files.
+            outputs: Output paths matching ``inputs``. Missing entries are generated.
+            options: Conversion options shared by all files. If None, uses defaults.
+            jobs: Number of worker processes. If None, uses the CPU count.
+            progress_callback: Optional callback receiving overall progress as
+                files complete.
+            
+        Returns:
+            Paths to the converted audio files, in the same order as ``inputs``.
+            
+        Raises:
+            ValueError: If the inputs and outputs don't match or any conversion fails.
+        """
+        inputs = list(inputs)
+        outputs = list(outputs) if outputs is not None else [None] * len(inputs)
+        if len(outputs) != len(inputs):
+            raise ValueError("Number of outputs must match number of inputs")
+        if not inputs:
+            return []
+        
+        options = options or ConversionOptions.default_options()
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(inputs)))
+        # Split the cores between the workers' FFmpeg processes
+        threads = max(1, (os.cpu_count() or 1) // jobs)
+        
+        results: List[Optional[str]] = [None] * len(inputs)
+        errors = []
+        done = 0
+        
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_batch_worker,
+            initargs=(self.ffmpeg_path, self.ffprobe_path, self.temp_dir, threads,
+                      self.simulation_mode)
+        ) as executor:
+            futures = {
+                executor.submit(_batch_convert_one, input_path, output_path, options): index
+                for index, (input_path, output_path) in enumerate(zip(inputs, outputs))
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Batch conversion failed for {inputs[index]}: {str(e)}")
+                    errors.append(inputs[index])
+                
+                done += 1
+                if progress_callback:
+                    progress_callback(done * 100.0 / len(inputs))
+        
+        if errors:
+            raise ValueError(f"Failed to convert {len(errors)} of {len(inputs)} files")
+        
+        return results
+
+    def convert_many_same_format(self, inputs: Sequence[str],
+                                 outputs: Optional[Sequence[Optional[str]]] = None,
+                                 options: Optional[ConversionOptions] = None) -> List[str]:
+        """
+        Convert several audio files with the same options in one FFmpeg process.
+        
+        Each input is mapped to its own output, so short clips don't pay the
+        cost of starting FFmpeg once per file. Use batch_convert for long files,
+        where parallel processes finish sooner.
+        
+        Args:
+            inputs: Paths to the input audio files.
+            outputs: Output paths matching ``inputs``. Missing entries are generated.
+            options: Conversion options shared by all files. If None, uses defaults.
+            
+        Returns:
+            Paths to the converted audio files, in the same order as ``inputs``.
+            
+        Raises:
+            ValueError: If the inputs and outputs don't match, an input doesn't
+                exist, or the conversion fails.
+            FileNotFoundError: If FFmpeg is not found.
+        """
+        inputs = list(inputs)
+        outputs = list(outputs) if outputs is not None else [None] * len(inputs)
+        if len(outputs) != len(inputs):
+            raise ValueError("Number of outputs must match number of inputs")
+        if not inputs:
+            return []
+        
+        options = options or ConversionOptions.default_options()
+        # Peak normalization needs a gain per input, everything else is shared
+        per_input = options.normalize and options.normalize_mode == "peak"
+        output_args = [] if per_input else self._output_args(options)
+        
+        cmd = [self.ffmpeg_path, "-y", *_QUIET_ARGS, *self._thread_args(options)]
+        for input_path in inputs:
+            if not os.path.exists(input_path):
+                raise ValueError(f"Input audio file not found: {input_path}")
+            cmd.extend(["-i", input_path])
+        
+        results = []
+        for index, (input_path, output_path) in enumerate(zip(inputs, outputs)):
+            if not output_path:
+                output_path = os.path.join(
+                    self.temp_dir,
+                    f"{Path(input_path).stem}.{options.format.extension}"
+                )
+            # Carry each input's own tags over instead of the first input's
+            cmd.extend(["-map", f"{index}:a:0", "-map_metadata", str(index)])
+            if per_input:
+                cmd.extend(self._output_args(options, input_path=input_path))
+            else:
+                cmd.extend(output_args)
+            cmd.append(output_path)
+            results.append(output_path)
+        
+        if self.simulation_mode:
+            logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
+            # Create small dummy audio files in simulation mode
+            for output_path in results:
+                with open(output_path, "wb") as f:
+                    f.write(b"\0" * 1024)  # 1KB dummy file
+            return results
+        
+        try:
+            self._run_quiet(cmd)
+            return results
+            
+        except subprocess.CalledProcessError as e:
+            error_msg = _error_message(e)
+            logger.error(f"FFmpeg error during multi-file conversion: {error_msg}")
+            raise ValueError(f"Failed to convert audio: {error_msg}")
+        except FileNotFoundError:
+            logger.error(f"FFmpeg not found at {self.ffmpeg_path}")
+            raise FileNotFoundError(f"FFmpeg not found at {self.ffmpeg_path}")
+        except Exception as e:
+            logger.error(f"Unexpected error during multi-file conversion: {str(e)}")
+            raise
+    
+    def _run_with_progress(self, cmd: List[str], duration: float,
+                           progress_callback: Callable[[float], None]) -> None:
+        """
+        Run an FFmpeg command, reporting progress from its ``-progress`` stream.
+        
+        FFmpeg writes structured ``key=value`` lines to stdout, so each update
+        is a single integer parse of ``out_time_us``.
+        
+        Args:
+            cmd: FFmpeg command; progress options are inserted after the executable.
+            duration: Duration of the input in seconds, used to compute percentages.
+            progress_callback: Callback for progress updates.
+            
+        Raises:
+            subprocess.CalledProcessError: If FFmpeg exits with an error.
+        """
+        progress_cmd = [cmd[0], "-progress", "pipe:1", *cmd[1:]]
+        
+        process = subprocess.Popen(
+            progress_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=-1
+        )
+        
+        # Drain the pipe in large chunks and only split out complete records
+        fd = process.stdout.fileno()
+        pending = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            
+            *records, pending = (pending + chunk).split(b"\n")
+            for line in records:
+                # Match on raw bytes; the records never need decoding
+                if line.startswith(_OUT_TIME_KEY) and duration > 0:
+                    value = line[len(_OUT_TIME_KEY):].strip()
+                    if value.isdigit():
+                        current_time = int(value) / 1_000_000
+                        progress_callback(min(100.0, (current_time / duration) * 100.0))
+        
+        process.stdout.close()
+        process.wait()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+    
+    def _run_quiet(self, cmd: List[str]) -> None:
+        """
+        Run an FFmpeg command without progress monitoring.
+        
+        Stdout is discarded and only stderr is captured, for error reporting.
+        
+        Args:
+            cmd: FFmpeg command to run.
+            
+        Raises:
+            subprocess.CalledProcessError: If FFmpeg exits with an error.
+        """
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    
+    def _build_cmd(self, input_path: str, output_path: str,
+                   options: ConversionOptions, drop_video: bool = False) -> List[str]:
+        """
+        Build the FFmpeg command for a single conversion.
+        
+        Args:
+            input_path: Path to the input media file.
+            output_path: Path for the output audio file.
+            options: Conversion options.
+            drop_video: Whether to discard any video streams in the input.
+            
+        Returns:
+            FFmpeg command as a list of arguments.
+        """
+        cmd = [self.ffmpeg_path, "-y", *_QUIET_ARGS, *self._thread_args(options)]
+        cmd.extend(["-i", input_path])
+        cmd.extend(self._output_args(options, drop_video, input_path))
+        cmd.append(output_path)
+        return cmd
+    
+    def _output_args(self, options: ConversionOptions, drop_video: bool = False,
+                     input_path: Optional[str] = None) -> List[str]:
+        """
+        Build the per-output FFmpeg arguments for a conversion.
+        
+        Args:
+            options: Conversion options.
+            drop_video: Whether to discard any video streams in the input.
+            input_path: Path to the input media file, scanned for peak normalization.
+            
+        Returns:
+            Arguments to place between the inputs and the output path.
+        """
+        args: List[str] = []
+        
+        # Add time range if specified
+        if options.start_time is not None:
+            args.extend(["-ss", str(options.start_time)])
+        if options.end_time is not None:
+            args.extend(["-to", str(options.end_time)])
+        
+        # Add audio options
+        if drop_video:
+            args.extend(_NO_VIDEO_ARGS)
+        args.extend(["-ar", str(options.sample_rate), "-ac", str(options.channels)])
+        
+        # Format-specific options
+        args.extend(_FORMAT_ARGS[options.format](options))
+        
+        # Limit encoder threads so parallel FFmpeg processes don't oversubscribe cores
+        if self.ffmpeg_threads:
+            args.extend(["-threads", str(self.ffmpeg_threads)])
+        
+        # Normalization if requested
+        if options.normalize:
+            if options.normalize_mode not in _NORMALIZE_MODES:
+                raise ValueError(f"Unsupported normalize mode: {options.normalize_mode}")
+            if options.normalize_mode == "peak" and input_path:
+                args.extend(["-af", f"volume={self._peak_gain(input_path):.2f}dB"])
+            else:
+                args.extend(_NORMALIZE_ARGS)
+        
+        # Add metadata if provided
+        args.extend(self._metadata_args(options))
+        return args
+    
+    def _metadata_args(self, options: ConversionOptions) -> List[str]:
+        """
+        Build the FFmpeg arguments that set the output's tags.
+        
+        Args:
+            options: Conversion options.
+            
+        Returns:
+            ``-metadata`` arguments for each tag, empty if there are none.
+        """
+        args: List[str] = []
+        if options.metadata:
+            for key, value in options.metadata.items():
+                args.extend(["-metadata", f"{key}={value}"])
+        return args
+    
+    def _peak_gain(self, input_path: str) -> float:
+        """
+        Measure the gain that brings a file's peak level to the target.
+        
+        Args:
+            input_path: Path to the input media file.
+            
+        Returns:
+            Gain in dB to apply with FFmpeg's volume filter.
+            
+        Raises:
+            ValueError: If the peak level can't be measured.
+        """
+        cmd = [
+            self.ffmpeg_path, "-hide_banner", "-nostats",
+            "-i", input_path,
+            "-vn", "-af", "volumedetect",
+            "-f", "null", os.devnull
+        ]
+        
+        if self.simulation_mode:
+            logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
+            return 0.0
+        
+        try:
+            result = subprocess.run(
+                cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+        except subprocess.CalledProcessError as e:
+            raise ValueError(f"Failed to measure peak level: {_error_message(e)}")
+        
+        match = _MAX_VOLUME_RE.search(result.stderr)
+        if not match:
+            raise ValueError(f"Failed to measure peak level of {input_path}")
+        
+        return _PEAK_TARGET_DB - float(match.group(1))
     
-    def get_metadata(self, file_path: str) -> Optional[AudioMetadata]:
+    def _thread_args(self, options: ConversionOptions) -> List[str]:
+        """
+        Get the global FFmpeg threading arguments for a conversion.
+        
+        Args:
+            options: Conversion options.
+            
+        Returns:
+            Arguments to place before the inputs, empty if threads are unlimited.
+        """
+        if not self.ffmpeg_threads or not options.normalize:
+            return []
+        
+        # loudnorm is CPU-bound, so cap the filter graph's threads as well
+        return ["-filter_threads", str(self.ffmpeg_threads)]
+    
+    def get_metadata(self, file_path: str,
+                     st: Optional[os.stat_result] = None) -> Optional[AudioMetadata]:
         """
         Get metadata from an audio or video file.
         
         Args:
             file_path: Path to the media file.
+            st: The file's ``os.stat`` result, if the caller already has it.
             
         Returns:
             AudioMetadata object if successful, None otherwise.
@@ -501,9 +1131,72 @@ class AudioConverter:
             ValueError: If the file doesn't exist or is not a valid media file.
             FileNotFoundError: If FFprobe is not found.
         """
-        if not os.path.exists(file_path):
-            raise ValueError(f"File not found: {file_path}")
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                raise ValueError(f"File not found: {file_path}")
+        
+        return self._probe_metadata(file_path, st)
+    
+    async def get_metadata_many(self, file_paths: Sequence[str],
+                                concurrency: Optional[int] = None) -> List[Optional[AudioMetadata]]:
+        """
+        Get metadata for many files, overlapping the FFprobe runs.
+        
+        Args:
+            file_paths: Paths to the media files.
+            concurrency: Maximum number of concurrent FFprobe processes. If None,
+                uses the CPU count.
+            
+        Returns:
+            Metadata for each file in the same order as ``file_paths``, with None
+            for files that couldn't be probed.
+        """
+        if not file_paths:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        workers = max(1, min(concurrency or os.cpu_count() or 1, len(file_paths)))
+        
+        # Probes go through get_metadata so they share its per-file cache
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return await asyncio.gather(*(
+                loop.run_in_executor(executor, self._get_metadata_or_none, file_path)
+                for file_path in file_paths
+            ))
+    
+    def _get_metadata_or_none(self, file_path: str) -> Optional[AudioMetadata]:
+        """
+        Get metadata from a media file, logging failures instead of raising.
+        
+        Args:
+            file_path: Path to the media file.
+            
+        Returns:
+            AudioMetadata object if successful, None otherwise.
+        """
+        try:
+            return self.get_metadata(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to get metadata for {file_path}: {str(e)}")
+            return None
+    
+    def _probe_metadata(self, file_path: str, st: os.stat_result) -> Optional[AudioMetadata]:
+        """
+        Get metadata for a file that has already been stat'ed.
         
+        Args:
+            file_path: Path to the media file.
+            st: Result of stat() on the file, used as the probe cache key.
+            
+        Returns:
+            AudioMetadata object if successful, None otherwise.
+            
+        Raises:
+            ValueError: If the file is not a valid media file.
+            FileNotFoundError: If FFprobe is not found.
+        """
         cmd = [
             self.ffprobe_path,
             "-v", "quiet",
@@ -526,8 +1219,16 @@ class AudioConverter:
             )
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            # Re-probe only when the file changes on disk
+            stdout = _probe_raw(tuple(cmd), st.st_mtime_ns, st.st_size)
+            if MSGSPEC_AVAILABLE:
+                try:
+                    return AudioMetadata.from_probe_result(_PROBE_DECODER.decode(stdout))
+                except msgspec.DecodeError:
+                    # Unexpected values such as "N/A"; use the lenient dict path
+                    pass
+            
+            data = _json_loads(stdout)
             return AudioMetadata.from_ffprobe_data(data)
             
         except subprocess.CalledProcessError as e:
@@ -555,11 +1256,155 @@ class AudioConverter:
             Duration in seconds, or 0 if not available.
         """
         try:
-            metadata = self.get_metadata(file_path)
-            return metadata.duration if metadata and metadata.duration else 0
+            return self._probe_duration_fast(file_path)
         except Exception:
             logger.warning(f"Couldn't get duration for {file_path}")
             return 0
+    
+    def _probe_duration_fast(self, file_path: str) -> float:
+        """
+        Get the duration of a media file with a minimal ffprobe query.
+        
+        Only the format duration is requested, so ffprobe skips stream
+        analysis and no JSON needs to be parsed.
+        
+        Args:
+            file_path: Path to the media file.
+            
+        Returns:
+            Duration in seconds, or 0 if not available.
+        """
+        st = os.stat(file_path)
+        
+        if self.simulation_mode:
+            return 180.0
+        
+        cmd = (
+            self.ffprobe_path,
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "csv=p=0",
+            file_path
+        )
+        return _probe_duration(cmd, st.st_mtime_ns, st.st_size)
+
+
+class FFmpegWorkerPool:
+    """
+    Pool that runs queued conversions through a fixed number of FFmpeg processes.
+    
+    Jobs that share the same options are grouped and handed to
+    AudioConverter.convert_many_same_format in chunks, so a batch of small
+    files costs one FFmpeg start per chunk instead of one per file. Jobs with
+    different options simply end up in separate groups.
+    """
+    
+    def __init__(self, converter: Optional[AudioConverter] = None,
+                 workers: Optional[int] = None, chunk_size: int = 16):
+        """
+        Initialize the worker pool.
+        
+        Args:
+            converter: Converter used to run FFmpeg. If None, creates a default one.
+            workers: Maximum number of concurrent FFmpeg processes. If None,
+                uses the CPU count.
+            chunk_size: Maximum number of files handled by one FFmpeg process.
+        """
+        self.converter = converter or AudioConverter()
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self._jobs: List[Tuple[str, Optional[str], ConversionOptions]] = []
+    
+    def submit(self, input_path: str, output_path: Optional[str] = None,
+               options: Optional[ConversionOptions] = None) -> None:
+        """
+        Queue a conversion to run on the next call to run().
+        
+        Args:
+            input_path: Path to the input audio file.
+            output_path: Path for the output audio file. If None, generates one.
+            options: Conversion options. If None, uses defaults.
+        """
+        self._jobs.append(
+            (input_path, output_path, options or ConversionOptions.default_options())
+        )
+    
+    def run(self) -> List[str]:
+        """
+        Run all queued conversions and clear the queue.
+        
+        Returns:
+            Paths to the converted audio files, in submission order.
+            
+        Raises:
+            ValueError: If any chunk of conversions fails.
+        """
+        jobs, self._jobs = self._jobs, []
+        
+        # Group job indices by options; the options dataclass isn't hashable
+        groups: List[Tuple[ConversionOptions, List[int]]] = []
+        for index, (_, _, options) in enumerate(jobs):
+            for group_options, indices in groups:
+                if group_options == options:
+                    indices.append(index)
+                    break
+            else:
+                groups.append((options, [index]))
+        
+        chunks = [
+            (options, indices[start:start + self.chunk_size])
+            for options, indices in groups
+            for start in range(0, len(indices), self.chunk_size)
+        ]
+        
+        results: List[Optional[str]] = [None] * len(jobs)
+        errors = []
+        
+        # Each thread just waits on its FFmpeg process, so threads are enough here
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(chunks) or 1)) as executor:
+            futures = {
+                executor.submit(
+                    self.converter.convert_many_same_format,
+                    [jobs[i][0] for i in indices],
+                    [jobs[i][1] for i in indices],
+                    options
+                ): indices
+                for options, indices in chunks
+            }
+            
+            for future in as_completed(futures):
+                indices = futures[future]
+                try:
+                    for index, output_path in zip(indices, future.result()):
+                        results[index] = output_path
+                except Exception as e:
+                    logger.error(f"Worker pool chunk of {len(indices)} files failed: {str(e)}")
+                    errors.extend(indices)
+        
+        if errors:
+            raise ValueError(f"Failed to convert {len(errors)} of {len(jobs)} files")
+        
+        return results
+
+
+# Per-process converter used by AudioConverter.batch_convert workers
+_batch_converter: Optional[AudioConverter] = None
+
+
+def _init_batch_worker(ffmpeg_path: str, ffprobe_path: str, temp_dir: str,
+                       ffmpeg_threads: int, simulation_mode: bool) -> None:
+    """Create the converter used by a batch worker process."""
+    global _batch_converter
+    
+    _batch_converter = AudioConverter(ffmpeg_path, ffprobe_path, temp_dir, ffmpeg_threads)
+    _batch_converter.simulation_mode = simulation_mode
+
+
+def _batch_convert_one(input_path: str, output_path: Optional[str],
+                       options: ConversionOptions) -> str:
+    """Convert a single file inside a batch worker process."""
+    # convert_audio may fill in metadata, so give each file its own copy
+    return _batch_converter.convert_audio(input_path, output_path, replace(options))
 
 
 if __name__ == "__main__":
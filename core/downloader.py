@@ -8,16 +8,23 @@ downloader based on the URL.
 
 import os
 import re
+import sys
+import time
+import functools
+import asyncio
 import logging
 import tempfile
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 import subprocess
 import json
 import requests
-from urllib.parse import urlparse, parse_qs
+from requests.adapters import HTTPAdapter
 
 # Import the custom utilities
 try:
@@ -28,9 +35,122 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from utils.env_loader import get_bool_env
 
+# Run yt-dlp in-process when the package is importable, avoiding an interpreter
+# start per call; otherwise fall back to the yt-dlp executable
+try:
+    import yt_dlp
+    from yt_dlp.utils import DownloadError
+    YT_DLP_AVAILABLE = True
+    _YT_DLP_ERRORS: Tuple[type, ...] = (DownloadError,)
+except ImportError:
+    YT_DLP_AVAILABLE = False
+    _YT_DLP_ERRORS = ()
+
+# Shared HTTP connection pool for the async API, when aiohttp is installed
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Parse buffered yt-dlp JSON with orjson when available
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Stream-parse yt-dlp's JSON output when ijson is installed
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _JSON_ERRORS: Tuple[type, ...] = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Patterns are compiled once here rather than looked up in re's cache per call
+_YT_URL_RE = re.compile(r'^(https?://)?(www\.)?(youtube\.com|youtube-nocookie\.com|youtu\.be)/.+$')
+_TW_URL_RE = re.compile(r'^(https?://)?(www\.)?(twitter\.com|x\.com)/.+$')
+# Video ID from any URL shape: youtu.be/ID, ?v=ID, /shorts/ID, /embed/ID, /v/ID, /live/ID
+_YT_ID_ANY_RE = re.compile(
+    r'(?:youtu\.be/|[?&]v=|/(?:shorts|embed|v|live)/)([a-zA-Z0-9_-]{11})(?![a-zA-Z0-9_-])'
+)
+_TWEET_ID_RE = re.compile(r'/(?:status|statuses)/(\d+)')
+
+# Machine-readable progress lines, "dl:<downloaded bytes>/<total bytes>"
+_PROGRESS_TEMPLATE = (
+    "download:dl:%(progress.downloaded_bytes)s/"
+    "%(progress.total_bytes,progress.total_bytes_estimate)s"
+)
+_PROGRESS_PREFIX = b"dl:"
+
+# Keep-alive connection pool for blocking HTTP requests such as thumbnails
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Long-lived yt-dlp instances per thread, so extractor setup and open
+# connections carry over between calls; YoutubeDL itself isn't thread-safe
+_YDL_LOCAL = threading.local()
+
+# Default download directory, and directories already created by a downloader
+_DEFAULT_DOWNLOAD_DIR = tempfile.gettempdir()
+_ENSURED_DIRS = set()
+
+# Fetched metadata keyed by "platform:video_id", with the monotonic time it was fetched
+_META_CACHE: Dict[str, Tuple[float, 'VideoMetadata']] = {}
+_META_CACHE_SIZE = 256
+
+# Top-level keys of yt-dlp's info dict that the downloaders read
+_INFO_KEYS = frozenset((
+    "title", "uploader", "duration", "thumbnail", "formats",
+    "description", "upload_date", "view_count", "like_count"
+))
+
+# Output template making yt-dlp print only those keys as one JSON object
+_INFO_PRINT_TEMPLATE = "%(.{" + ",".join(sorted(_INFO_KEYS)) + "})j"
+
+
+def _dispatch_progress(status: Dict[str, Any]) -> None:
+    """Forward a yt-dlp progress update to the hook of the current call, if any."""
+    hook = getattr(_YDL_LOCAL, "progress_hook", None)
+    if hook is not None:
+        hook(status)
+
+
+def _cache_metadata(key: str, metadata: 'VideoMetadata') -> None:
+    """Store fetched metadata, evicting the oldest entry once the cache is full."""
+    _META_CACHE[key] = (time.monotonic(), metadata)
+    if len(_META_CACHE) > _META_CACHE_SIZE:
+        # Drop the oldest entry; dicts keep insertion order
+        _META_CACHE.pop(next(iter(_META_CACHE)), None)
+
+
+def _grow_pipe(fd: int) -> None:
+    """
+    Raise a pipe's kernel buffer to 1 MiB on Linux so bursts of output fit.
+    
+    Args:
+        fd: File descriptor of the pipe.
+    """
+    if sys.platform != "linux":
+        return
+    
+    try:
+        import fcntl
+        fcntl.fcntl(fd, getattr(fcntl, "F_SETPIPE_SZ", 1031), 1 << 20)
+    except OSError:
+        # Above the system limit for unprivileged users; the default size still works
+        pass
+
+
+# dataclass(slots=...) is only accepted from Python 3.10 onwards
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class VideoMetadata:
     """Data class for storing video metadata."""
     
@@ -58,6 +178,19 @@ class VideoMetadata:
 class BaseDownloader(ABC):
     """Abstract base class for platform-specific downloaders."""
     
+    PLATFORM_NAME = ""
+    # Regex alternation of the hosts this downloader handles, e.g. r'example\.com'
+    HOST_PATTERN = ""
+    # Seconds that fetched metadata stays valid in the cache
+    METADATA_CACHE_TTL = 300.0
+    # Maximum number of blocking downloader calls the async API runs at once
+    MAX_ASYNC_WORKERS = 8
+    
+    _executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _session: ClassVar[Optional['aiohttp.ClientSession']] = None
+    _session_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, download_dir: Optional[str] = None):
         """
         Initialize the downloader.
@@ -65,8 +198,10 @@ class BaseDownloader(ABC):
         Args:
             download_dir: Directory to save downloaded files. If None, uses temp dir.
         """
-        self.download_dir = download_dir or tempfile.gettempdir()
-        os.makedirs(self.download_dir, exist_ok=True)
+        self.download_dir = download_dir or _DEFAULT_DOWNLOAD_DIR
+        if self.download_dir not in _ENSURED_DIRS:
+            os.makedirs(self.download_dir, exist_ok=True)
+            _ENSURED_DIRS.add(self.download_dir)
         self.simulation_mode = get_bool_env("SIMULATION_MODE", False)
         
     @abstractmethod
@@ -85,11 +220,43 @@ class BaseDownloader(ABC):
         """
         pass
     
-    @abstractmethod
-    def get_metadata(self, url: str) -> VideoMetadata:
+    def get_metadata(self, url: str, max_age: Optional[float] = None) -> VideoMetadata:
         """
         Get metadata for the video at the given URL.
         
+        Results are cached per platform and video ID, so looking at a video
+        and then downloading it only fetches its metadata once.
+        
+        Args:
+            url: The URL of the video.
+            max_age: Oldest cached result to accept, in seconds. If None, uses
+                METADATA_CACHE_TTL; 0 always fetches fresh metadata.
+            
+        Returns:
+            A VideoMetadata object containing the video's metadata.
+            
+        Raises:
+            ValueError: If the URL is invalid or the metadata cannot be fetched.
+        """
+        max_age = self.METADATA_CACHE_TTL if max_age is None else max_age
+        if self.simulation_mode or max_age <= 0:
+            return self._fetch_metadata(url)
+        
+        key = f"{self.PLATFORM_NAME}:{self.extract_id_from_url(url)}"
+        cached = _META_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        
+        metadata = self._fetch_metadata(url)
+        _cache_metadata(key, metadata)
+        
+        return metadata
+    
+    @abstractmethod
+    def _fetch_metadata(self, url: str) -> VideoMetadata:
+        """
+        Fetch metadata for the video at the given URL, bypassing the cache.
+        
         Args:
             url: The URL of the video.
             
@@ -101,9 +268,14 @@ class BaseDownloader(ABC):
         """
         pass
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all cached video metadata."""
+        _META_CACHE.clear()
+    
     @abstractmethod
     def download(self, url: str, format_id: Optional[str] = None, 
-                 progress_callback=None) -> str:
+                 progress_callback=None, *, video_id: Optional[str] = None) -> str:
         """
         Download the video at the given URL.
         
@@ -111,6 +283,8 @@ class BaseDownloader(ABC):
             url: The URL of the video to download.
             format_id: Optional format ID to download. If None, uses best quality.
             progress_callback: Optional callback for progress updates.
+            video_id: The video's ID, if already known (e.g. from get_metadata()),
+                to skip extracting it from the URL again.
             
         Returns:
             The path to the downloaded file.
@@ -119,20 +293,245 @@ class BaseDownloader(ABC):
             ValueError: If the URL is invalid or the download fails.
         """
         pass
+    
+    def download_with_metadata(self, url: str, format_id: Optional[str] = None,
+                               progress_callback: Optional[Callable[[float], None]] = None
+                               ) -> Tuple[VideoMetadata, str]:
+        """
+        Download a video and get its metadata.
+        
+        Downloaders that can get both from one request override this.
+        
+        Args:
+            url: The URL of the video to download.
+            format_id: Optional format ID to download. If None, uses best quality.
+            progress_callback: Optional callback for progress updates.
+            
+        Returns:
+            A tuple of the video's metadata and the path to the downloaded file.
+            
+        Raises:
+            ValueError: If the URL is invalid or the download fails.
+        """
+        metadata = self.get_metadata(url)
+        return metadata, self.download(url, format_id, progress_callback,
+                                       video_id=metadata.video_id)
+    
+    def download_many(self, urls: List[str], format_id: Optional[str] = None,
+                      progress_callback: Optional[Callable[[float], None]] = None) -> List[str]:
+        """
+        Download several videos from this platform.
+        
+        Downloaders that can batch requests override this; the default
+        downloads the videos one after another.
+        
+        Args:
+            urls: The URLs of the videos to download.
+            format_id: Optional format ID to download. If None, uses best quality.
+            progress_callback: Optional callback receiving overall progress.
+            
+        Returns:
+            The paths to the downloaded files, in the same order as ``urls``.
+            
+        Raises:
+            ValueError: If a URL is invalid or the download fails.
+        """
+        paths = []
+        for index, url in enumerate(urls):
+            callback = None
+            if progress_callback:
+                def callback(progress: float, offset: int = index) -> None:
+                    progress_callback((offset * 100.0 + progress) / len(urls))
+            paths.append(self.download(url, format_id, callback))
+        return paths
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the thread pool shared by all downloaders' async calls."""
+        if BaseDownloader._executor is None:
+            with BaseDownloader._shared_lock:
+                if BaseDownloader._executor is None:
+                    BaseDownloader._executor = ThreadPoolExecutor(
+                        max_workers=cls.MAX_ASYNC_WORKERS,
+                        thread_name_prefix="downloader"
+                    )
+        return BaseDownloader._executor
+    
+    async def aget_metadata(self, url: str) -> VideoMetadata:
+        """
+        Get metadata for the video at the given URL without blocking the event loop.
+        
+        Args:
+            url: The URL of the video.
+            
+        Returns:
+            A VideoMetadata object containing the video's metadata.
+            
+        Raises:
+            ValueError: If the URL is invalid or the metadata cannot be fetched.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.get_metadata, url)
+    
+    async def aget_metadata_many(self, urls: List[str],
+                                 concurrency: int = 8) -> List[Union[VideoMetadata, Exception]]:
+        """
+        Get metadata for several videos, fetching up to ``concurrency`` at once.
+        
+        Args:
+            urls: The URLs of the videos.
+            concurrency: Maximum number of metadata fetches in flight.
+            
+        Returns:
+            Metadata for each URL in the same order as ``urls``, or the exception
+            raised for a URL whose metadata couldn't be fetched.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def bounded(url: str) -> VideoMetadata:
+            async with semaphore:
+                return await self.aget_metadata(url)
+        
+        return await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
+    
+    async def adownload(self, url: str, format_id: Optional[str] = None,
+                        progress_callback=None, *, video_id: Optional[str] = None) -> str:
+        """
+        Download the video at the given URL without blocking the event loop.
+        
+        Args:
+            url: The URL of the video to download.
+            format_id: Optional format ID to download. If None, uses best quality.
+            progress_callback: Optional callback for progress updates, called
+                from a worker thread.
+            video_id: The video's ID, if already known.
+            
+        Returns:
+            The path to the downloaded file.
+            
+        Raises:
+            ValueError: If the URL is invalid or the download fails.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(self.download, url, format_id, progress_callback, video_id=video_id)
+        )
+    
+    @classmethod
+    def get_session(cls) -> 'aiohttp.ClientSession':
+        """
+        Get the aiohttp session shared by all downloaders on the running loop.
+        
+        Connections are kept alive and reused across requests and downloaders.
+        
+        Returns:
+            The shared client session.
+            
+        Raises:
+            RuntimeError: If aiohttp is not installed or no event loop is running.
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is required for the shared HTTP session")
+        
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to their event loop, so replace one from an earlier loop
+        if (BaseDownloader._session is None or BaseDownloader._session.closed
+                or BaseDownloader._session_loop is not loop):
+            BaseDownloader._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60)
+            )
+            BaseDownloader._session_loop = loop
+        return BaseDownloader._session
+    
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared aiohttp session, if one is open."""
+        session = BaseDownloader._session
+        BaseDownloader._session = None
+        BaseDownloader._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def afetch_thumbnail(self, metadata: VideoMetadata) -> bytes:
+        """
+        Fetch a video's thumbnail image.
+        
+        Uses the shared aiohttp session when available, otherwise requests in
+        the shared thread pool.
+        
+        Args:
+            metadata: Metadata of the video.
+            
+        Returns:
+            The raw image data.
+            
+        Raises:
+            ValueError: If the video has no thumbnail or it can't be fetched.
+        """
+        if not metadata.thumbnail_url:
+            raise ValueError(f"No thumbnail available for video: {metadata.video_id}")
+        
+        try:
+            if AIOHTTP_AVAILABLE:
+                async with self.get_session().get(metadata.thumbnail_url) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            
+            def fetch() -> bytes:
+                response = _SESSION.get(metadata.thumbnail_url, timeout=30)
+                response.raise_for_status()
+                return response.content
+            
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fetch)
+            
+        except Exception as e:
+            logger.error(f"Error fetching thumbnail for {metadata.video_id}: {str(e)}")
+            raise ValueError(f"Failed to fetch thumbnail: {str(e)}")
 
 
-class YouTubeDownloader(BaseDownloader):
-    """Downloader for YouTube videos using yt-dlp."""
+@functools.lru_cache(maxsize=1024)
+def _extract_youtube_id(url: str) -> str:
+    """Extract the video ID from a YouTube URL; cached per URL."""
+    match = _YT_ID_ANY_RE.search(url)
+    if not match:
+        raise ValueError(f"Could not extract video ID from URL: {url}")
     
-    PLATFORM_NAME = "youtube"
-    URL_PATTERNS = [
-        r'^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$'
-    ]
+    return match.group(1)
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_tweet_id(url: str) -> str:
+    """Extract the tweet ID from a Twitter URL; cached per URL."""
+    # Support both twitter.com and x.com
+    match = _TWEET_ID_RE.search(url)
+    if not match:
+        raise ValueError(f"Could not extract tweet ID from URL: {url}")
+    
+    return match.group(1)
+
+
+class _YtDlpBackend(BaseDownloader):
+    """Base class for downloaders that fetch videos with yt-dlp."""
+    
+    # Platform name used in log and error messages
+    DISPLAY_NAME = ""
+    # Output file name relative to download_dir; "{id}" is replaced by the video ID
+    FILENAME_TEMPLATE = "%(title)s-{id}.%(ext)s"
+    # Substring identifying a video's downloaded file; "{id}" as above
+    FILE_MARKER = "{id}"
+    # File name returned by download() in simulation mode; "{id}" as above
+    SIMULATION_FILENAME = "simulation-video-{id}.mp4"
+    # Author reported when yt-dlp doesn't know the uploader
+    UNKNOWN_AUTHOR = "Unknown Author"
+    # Whether to ignore the playlist a video URL may belong to
+    NO_PLAYLIST = False
     
     def __init__(self, download_dir: Optional[str] = None, 
                  yt_dlp_path: Optional[str] = None):
         """
-        Initialize the YouTube downloader.
+        Initialize the downloader.
         
         Args:
             download_dir: Directory to save downloaded files.
@@ -140,328 +539,512 @@ class YouTubeDownloader(BaseDownloader):
         """
         super().__init__(download_dir)
         self.yt_dlp_path = yt_dlp_path or "yt-dlp"
+    
+    @abstractmethod
+    def _simulation_metadata(self, video_id: str, url: str) -> VideoMetadata:
+        """
+        Build the dummy metadata returned in simulation mode.
         
-    def extract_id_from_url(self, url: str) -> str:
-        """Extract the video ID from a YouTube URL."""
-        if "youtu.be" in url:
-            # Short URL format
-            path = urlparse(url).path
-            video_id = path.strip("/")
-        else:
-            # Regular youtube.com URL
-            parsed_url = urlparse(url)
-            query_params = parse_qs(parsed_url.query)
-            
-            if "v" in query_params:
-                video_id = query_params["v"][0]
-            else:
-                # Try to extract from path for shorts or other formats
-                match = re.search(r'/([a-zA-Z0-9_-]{11})(?:/|$)', parsed_url.path)
-                if match:
-                    video_id = match.group(1)
-                else:
-                    raise ValueError(f"Could not extract video ID from URL: {url}")
-        
-        # Validate video ID format
-        if not re.match(r'^[a-zA-Z0-9_-]{11}$', video_id):
-            raise ValueError(f"Invalid YouTube video ID format: {video_id}")
+        Args:
+            video_id: The video's ID.
+            url: The URL of the video.
             
-        return video_id
+        Returns:
+            Placeholder metadata for the video.
+        """
+        pass
     
-    def get_metadata(self, url: str) -> VideoMetadata:
-        """Get metadata for a YouTube video."""
+    def _fetch_metadata(self, url: str) -> VideoMetadata:
+        """Fetch metadata for a video from yt-dlp."""
         try:
             video_id = self.extract_id_from_url(url)
             
             # Run yt-dlp to get video info
-            cmd = [
-                self.yt_dlp_path,
-                "--dump-json",
-                "--no-playlist",
-                url
-            ]
+            cmd = [self.yt_dlp_path, "--print", _INFO_PRINT_TEMPLATE]
+            if self.NO_PLAYLIST:
+                cmd.append("--no-playlist")
+            cmd.append(url)
             
             if self.simulation_mode:
                 logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
                 # Return dummy metadata in simulation mode
-                return VideoMetadata(
-                    video_id=video_id,
-                    title="Simulation Video",
-                    author="Simulation Channel",
-                    duration=180.0,
-                    thumbnail_url="https://example.com/thumbnail.jpg",
-                    platform=self.PLATFORM_NAME,
-                    formats=[
-                        {"format_id": "22", "ext": "mp4", "resolution": "720p", 
-                         "filesize": 1024*1024*10}
-                    ],
-                    original_url=url
-                )
+                return self._simulation_metadata(video_id, url)
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            video_info = json.loads(result.stdout)
-            
-            # Extract relevant metadata
-            formats = []
-            for fmt in video_info.get('formats', []):
-                if fmt.get('acodec') != 'none' and fmt.get('vcodec') != 'none':
-                    formats.append({
-                        'format_id': fmt.get('format_id'),
-                        'ext': fmt.get('ext'),
-                        'resolution': fmt.get('resolution') or f"{fmt.get('width', 0)}x{fmt.get('height', 0)}",
-                        'filesize': fmt.get('filesize') or fmt.get('filesize_approx')
-                    })
-            
-            return VideoMetadata(
-                video_id=video_id,
-                title=video_info.get('title', 'Unknown Title'),
-                author=video_info.get('uploader', 'Unknown Author'),
-                duration=float(video_info.get('duration', 0)),
-                thumbnail_url=video_info.get('thumbnail', ''),
-                platform=self.PLATFORM_NAME,
-                formats=formats,
-                original_url=url,
-                description=video_info.get('description'),
-                upload_date=video_info.get('upload_date'),
-                view_count=video_info.get('view_count'),
-                like_count=video_info.get('like_count')
+            video_info = self._extract_info(
+                url, cmd, {"noplaylist": True} if self.NO_PLAYLIST else {}
             )
+            return self._info_to_metadata(video_info, url)
             
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.strip() if e.stderr else str(e)
-            logger.error(f"Error fetching YouTube metadata: {error_msg}")
-            raise ValueError(f"Failed to get metadata for YouTube video: {error_msg}")
-        except json.JSONDecodeError:
+            logger.error(f"Error fetching {self.DISPLAY_NAME} metadata: {error_msg}")
+            raise ValueError(f"Failed to get metadata for {self.DISPLAY_NAME} video: {error_msg}")
+        except _YT_DLP_ERRORS as e:
+            logger.error(f"Error fetching {self.DISPLAY_NAME} metadata: {str(e)}")
+            raise ValueError(f"Failed to get metadata for {self.DISPLAY_NAME} video: {str(e)}")
+        except _JSON_ERRORS:
             logger.error("Failed to parse yt-dlp JSON output")
             raise ValueError("Failed to parse video metadata")
         except Exception as e:
             logger.error(f"Unexpected error in get_metadata: {str(e)}")
             raise
     
-    def download(self, url: str, format_id: Optional[str] = None, 
-                 progress_callback=None) -> str:
-        """Download a YouTube video."""
-        try:
-            video_id = self.extract_id_from_url(url)
-            output_template = os.path.join(self.download_dir, f"%(title)s-{video_id}.%(ext)s")
+    def _info_to_metadata(self, info: Dict[str, Any], url: str) -> VideoMetadata:
+        """
+        Build a VideoMetadata object from a yt-dlp info dict.
+        
+        Args:
+            info: The info dict, with at least the keys in ``_INFO_KEYS``.
+            url: The URL the info was fetched for.
             
-            cmd = [
-                self.yt_dlp_path,
-                "--no-playlist",
-                "--no-warnings",
-                "-o", output_template
-            ]
+        Returns:
+            A VideoMetadata object containing the video's metadata.
+        """
+        video_id = self.extract_id_from_url(url)
+        get = info.get
+        return VideoMetadata(
+            video_id=video_id,
+            title=self._title_from_info(info, video_id),
+            author=get('uploader', self.UNKNOWN_AUTHOR),
+            duration=float(get('duration', 0)),
+            thumbnail_url=get('thumbnail', ''),
+            platform=self.PLATFORM_NAME,
+            formats=self._formats_from_info(info),
+            original_url=url,
+            description=get('description'),
+            upload_date=get('upload_date'),
+            view_count=get('view_count'),
+            like_count=get('like_count')
+        )
+    
+    def _title_from_info(self, info: Dict[str, Any], video_id: str) -> str:
+        """
+        Get the title to show for a video.
+        
+        Args:
+            info: The yt-dlp info dict.
+            video_id: The video's ID.
             
-            if format_id:
-                cmd.extend(["-f", format_id])
-            else:
-                cmd.extend(["-f", "best"])
+        Returns:
+            The video's title.
+        """
+        return info.get('title', 'Unknown Title')
+    
+    @staticmethod
+    def _formats_from_info(info: Dict[str, Any]) -> List[Dict[str, Union[str, int]]]:
+        """
+        List the formats of an info dict that carry both audio and video.
+        
+        Args:
+            info: The yt-dlp info dict.
             
-            cmd.append(url)
+        Returns:
+            The format descriptions stored in VideoMetadata.formats.
+        """
+        formats = []
+        append = formats.append
+        for fmt in info.get('formats') or ():
+            get = fmt.get
+            if get('acodec') == 'none' or get('vcodec') == 'none':
+                continue
+            append({
+                'format_id': get('format_id'),
+                'ext': get('ext'),
+                'resolution': get('resolution') or f"{get('width', 0)}x{get('height', 0)}",
+                'filesize': get('filesize') or get('filesize_approx')
+            })
+        return formats
+    
+    def download(self, url: str, format_id: Optional[str] = None, 
+                 progress_callback=None, *, video_id: Optional[str] = None) -> str:
+        """Download a video with yt-dlp."""
+        try:
+            video_id = video_id or self.extract_id_from_url(url)
+            output_template = os.path.join(
+                self.download_dir, self.FILENAME_TEMPLATE.format(id=video_id)
+            )
+            cmd, opts = self._download_command([url], output_template, format_id)
             
             if self.simulation_mode:
                 logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
                 # Return a dummy file path in simulation mode
-                return os.path.join(self.download_dir, f"simulation-video-{video_id}.mp4")
-            
-            if progress_callback:
-                # Run with progress updates
-                process = subprocess.Popen(
-                    cmd, 
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True
+                return os.path.join(
+                    self.download_dir, self.SIMULATION_FILENAME.format(id=video_id)
                 )
-                
-                for line in process.stdout:
-                    if "download" in line.lower() and "%" in line:
-                        try:
-                            # Extract progress percentage
-                            match = re.search(r'(\d+\.\d+)%', line)
-                            if match:
-                                progress = float(match.group(1))
-                                progress_callback(progress)
-                        except Exception:
-                            # Continue even if progress parsing fails
-                            pass
-                
-                process.wait()
-                if process.returncode != 0:
-                    raise subprocess.CalledProcessError(process.returncode, cmd)
-            else:
-                # Run without progress updates
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
             
-            # Find the downloaded file
-            for file in os.listdir(self.download_dir):
-                if video_id in file:
-                    return os.path.join(self.download_dir, file)
+            paths = self._run_download([url], cmd, opts, progress_callback)
+            if not paths:
+                raise ValueError("Downloaded file not found")
             
-            raise ValueError("Downloaded file not found")
+            return paths[-1]
             
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.strip() if e.stderr else str(e)
-            logger.error(f"Error downloading YouTube video: {error_msg}")
-            raise ValueError(f"Failed to download YouTube video: {error_msg}")
+            logger.error(f"Error downloading {self.DISPLAY_NAME} video: {error_msg}")
+            raise ValueError(f"Failed to download {self.DISPLAY_NAME} video: {error_msg}")
+        except _YT_DLP_ERRORS as e:
+            logger.error(f"Error downloading {self.DISPLAY_NAME} video: {str(e)}")
+            raise ValueError(f"Failed to download {self.DISPLAY_NAME} video: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in download: {str(e)}")
             raise
-
-
-class TwitterDownloader(BaseDownloader):
-    """Downloader for Twitter videos."""
     
-    PLATFORM_NAME = "twitter"
-    URL_PATTERNS = [
-        r'^(https?://)?(www\.)?(twitter\.com|x\.com)/.+$'
-    ]
-    
-    def __init__(self, download_dir: Optional[str] = None, 
-                 yt_dlp_path: Optional[str] = None):
+    def download_with_metadata(self, url: str, format_id: Optional[str] = None,
+                               progress_callback: Optional[Callable[[float], None]] = None
+                               ) -> Tuple[VideoMetadata, str]:
         """
-        Initialize the Twitter downloader.
+        Download a video and get its metadata from the same yt-dlp run.
+        
+        Calling get_metadata() and then download() runs the extractor twice
+        for the same video; this pays for it once. The metadata is also
+        cached for later get_metadata() calls.
         
         Args:
-            download_dir: Directory to save downloaded files.
-            yt_dlp_path: Path to the yt-dlp executable. If None, assumes it's in PATH.
+            url: The URL of the video to download.
+            format_id: Optional format ID to download. If None, uses best quality.
+            progress_callback: Optional callback for progress updates.
+            
+        Returns:
+            A tuple of the video's metadata and the path to the downloaded file.
+            
+        Raises:
+            ValueError: If the URL is invalid or the download fails.
         """
-        super().__init__(download_dir)
-        self.yt_dlp_path = yt_dlp_path or "yt-dlp"
-    
-    def extract_id_from_url(self, url: str) -> str:
-        """Extract the tweet ID from a Twitter URL."""
-        # Support both twitter.com and x.com
-        match = re.search(r'/(status|statuses)/(\d+)', url)
-        if not match:
-            raise ValueError(f"Could not extract tweet ID from URL: {url}")
+        video_id = self.extract_id_from_url(url)
         
-        tweet_id = match.group(2)
-        return tweet_id
-    
-    def get_metadata(self, url: str) -> VideoMetadata:
-        """Get metadata for a Twitter video."""
+        if self.simulation_mode:
+            return (self._fetch_metadata(url),
+                    self.download(url, format_id, progress_callback, video_id=video_id))
+        
+        output_template = os.path.join(
+            self.download_dir, self.FILENAME_TEMPLATE.format(id=video_id)
+        )
+        cmd, opts = self._download_command([url], output_template, format_id)
+        
+        infos = []
         try:
-            tweet_id = self.extract_id_from_url(url)
+            paths = self._run_download([url], cmd, opts, progress_callback, infos=infos)
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.strip() if e.stderr else str(e)
+            logger.error(f"Error downloading {self.DISPLAY_NAME} video: {error_msg}")
+            raise ValueError(f"Failed to download {self.DISPLAY_NAME} video: {error_msg}")
+        except _YT_DLP_ERRORS as e:
+            logger.error(f"Error downloading {self.DISPLAY_NAME} video: {str(e)}")
+            raise ValueError(f"Failed to download {self.DISPLAY_NAME} video: {str(e)}")
+        except _JSON_ERRORS:
+            logger.error("Failed to parse yt-dlp JSON output")
+            raise ValueError("Failed to parse video metadata")
+        
+        if not paths or not infos:
+            raise ValueError("Downloaded file not found")
+        
+        metadata = self._info_to_metadata(infos[-1], url)
+        _cache_metadata(f"{self.PLATFORM_NAME}:{video_id}", metadata)
+        
+        return metadata, paths[-1]
+    
+    def download_many(self, urls: List[str], format_id: Optional[str] = None,
+                      progress_callback: Optional[Callable[[float], None]] = None) -> List[str]:
+        """
+        Download several videos from this platform in a single yt-dlp run.
+        
+        yt-dlp's startup and extractor setup are paid once for the whole list,
+        and its HTTP connections are reused between videos.
+        
+        Args:
+            urls: The URLs of the videos to download.
+            format_id: Optional format ID to download. If None, uses best quality.
+            progress_callback: Optional callback receiving overall progress.
             
-            # Run yt-dlp to get video info
-            cmd = [
-                self.yt_dlp_path,
-                "--dump-json",
-                url
+        Returns:
+            The paths to the downloaded files, in the same order as ``urls``.
+            
+        Raises:
+            ValueError: If a URL is invalid or the download fails.
+        """
+        if not urls:
+            return []
+        
+        video_ids = [self.extract_id_from_url(url) for url in urls]
+        output_template = os.path.join(
+            self.download_dir, self.FILENAME_TEMPLATE.format(id="%(id)s")
+        )
+        
+        cmd, opts = self._download_command(list(urls), output_template, format_id)
+        
+        if self.simulation_mode:
+            logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
+            # Return dummy file paths in simulation mode
+            return [
+                os.path.join(self.download_dir, self.SIMULATION_FILENAME.format(id=video_id))
+                for video_id in video_ids
             ]
+        
+        overall_callback = None
+        if progress_callback:
+            # Per-file progress restarts from zero for each video; fold it into a total
+            state = {"index": 0, "last": 0.0}
             
-            if self.simulation_mode:
-                logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
-                # Return dummy metadata in simulation mode
-                return VideoMetadata(
-                    video_id=tweet_id,
-                    title=f"Twitter Video {tweet_id}",
-                    author="Twitter User",
-                    duration=60.0,
-                    thumbnail_url="https://example.com/twitter_thumbnail.jpg",
-                    platform=self.PLATFORM_NAME,
-                    formats=[
-                        {"format_id": "best", "ext": "mp4", "resolution": "720p", 
-                         "filesize": 1024*1024*5}
-                    ],
-                    original_url=url
-                )
+            def overall_callback(progress: float) -> None:
+                if progress < state["last"]:
+                    state["index"] = min(state["index"] + 1, len(urls) - 1)
+                state["last"] = progress
+                progress_callback((state["index"] * 100.0 + progress) / len(urls))
+        
+        try:
+            paths = self._run_download(list(urls), cmd, opts, overall_callback)
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.strip() if e.stderr else str(e)
+            logger.error(f"Error downloading {self.DISPLAY_NAME} videos: {error_msg}")
+            raise ValueError(f"Failed to download {self.DISPLAY_NAME} videos: {error_msg}")
+        except _YT_DLP_ERRORS as e:
+            logger.error(f"Error downloading {self.DISPLAY_NAME} videos: {str(e)}")
+            raise ValueError(f"Failed to download {self.DISPLAY_NAME} videos: {str(e)}")
+        
+        # yt-dlp handles the URLs in order, so its paths line up unless one failed
+        if len(paths) == len(urls):
+            return paths
+        
+        # Otherwise find the downloaded files with a single directory listing
+        markers = [self.FILE_MARKER.format(id=video_id) for video_id in video_ids]
+        paths = [None] * len(urls)
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                for index, marker in enumerate(markers):
+                    if paths[index] is None and marker in entry.name:
+                        paths[index] = entry.path
+        
+        missing = [url for url, path in zip(urls, paths) if path is None]
+        if missing:
+            raise ValueError(f"Downloaded file not found for: {', '.join(missing)}")
+        
+        return paths
+    
+    def _download_command(self, urls: List[str], output_template: str,
+                          format_id: Optional[str] = None) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Build the yt-dlp command and equivalent in-process options for a download.
+        
+        Args:
+            urls: The URLs of the videos to download.
+            output_template: yt-dlp output template for the downloaded files.
+            format_id: Optional format ID to download. If None, uses best quality.
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            video_info = json.loads(result.stdout)
-            
-            # Extract relevant metadata
-            formats = []
-            for fmt in video_info.get('formats', []):
-                if fmt.get('acodec') != 'none' and fmt.get('vcodec') != 'none':
-                    formats.append({
-                        'format_id': fmt.get('format_id'),
-                        'ext': fmt.get('ext'),
-                        'resolution': fmt.get('resolution') or f"{fmt.get('width', 0)}x{fmt.get('height', 0)}",
-                        'filesize': fmt.get('filesize') or fmt.get('filesize_approx')
-                    })
-            
-            # Twitter videos often don't have proper titles, create one from tweet text
-            title = video_info.get('title', '').strip()
-            if not title or title == "Twitter":
-                # Try to create a title from description or just use tweet ID
-                desc = video_info.get('description', '')
-                if desc:
-                    # Use first 50 chars of description as title
-                    title = desc[:50] + ('...' if len(desc) > 50 else '')
-                else:
-                    title = f"Twitter Video {tweet_id}"
-            
-            return VideoMetadata(
-                video_id=tweet_id,
-                title=title,
-                author=video_info.get('uploader', 'Unknown User'),
-                duration=float(video_info.get('duration', 0)),
-                thumbnail_url=video_info.get('thumbnail', ''),
-                platform=self.PLATFORM_NAME,
-                formats=formats,
-                original_url=url,
-                description=video_info.get('description'),
-                upload_date=video_info.get('upload_date')
-            )
+        Returns:
+            A tuple of the command line and the YoutubeDL options.
+        """
+        cmd = [self.yt_dlp_path]
+        if self.NO_PLAYLIST:
+            cmd.append("--no-playlist")
+        cmd.extend(["--no-warnings", "-o", output_template, "-f", format_id or "best", *urls])
+        
+        opts = {"outtmpl": output_template, "format": format_id or "best",
+                "noplaylist": self.NO_PLAYLIST}
+        return cmd, opts
+    
+    @contextlib.contextmanager
+    def _ydl(self, opts: Dict[str, Any],
+             progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+             ) -> Iterator['yt_dlp.YoutubeDL']:
+        """
+        Borrow the calling thread's yt-dlp instance for a set of options.
+        
+        Instances are created once per thread and option set, with quiet
+        defaults, and kept open so later calls reuse their HTTP connections.
+        The output template is applied per call rather than being part of
+        the option set.
+        
+        Args:
+            opts: yt-dlp options to add to the defaults.
+            progress_hook: Optional yt-dlp progress hook for this call only.
             
+        Yields:
+            The YoutubeDL instance.
+        """
+        opts = dict(opts)
+        outtmpl = opts.pop("outtmpl", None)
+        
+        instances = _YDL_LOCAL.__dict__.setdefault("instances", {})
+        key = tuple(sorted(opts.items()))
+        ydl = instances.get(key)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({
+                "quiet": True, "no_warnings": True, "noprogress": True, **opts,
+                "progress_hooks": [_dispatch_progress]
+            })
+            instances[key] = ydl
+        
+        if outtmpl is not None:
+            ydl.params["outtmpl"]["default"] = outtmpl
+        _YDL_LOCAL.progress_hook = progress_hook
+        try:
+            yield ydl
+        finally:
+            _YDL_LOCAL.progress_hook = None
+    
+    def _extract_info(self, url: str, cmd: List[str], opts: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get yt-dlp's info dict for a URL without downloading it.
+        
+        Args:
+            url: The URL of the video.
+            cmd: Equivalent yt-dlp command, used when the package isn't installed.
+            opts: yt-dlp options for the in-process call.
+            
+        Returns:
+            The info dict, with the same keys as ``--dump-json`` output.
+            
+        Raises:
+            subprocess.CalledProcessError: If the yt-dlp executable fails.
+            yt_dlp.utils.DownloadError: If the in-process extraction fails.
+        """
+        if YT_DLP_AVAILABLE:
+            with self._ydl({"skip_download": True, **opts}) as ydl:
+                return ydl.extract_info(url, download=False)
+        
+        if IJSON_AVAILABLE:
+            return self._stream_info(cmd)
+        
+        try:
+            # Keep stdout as bytes; orjson parses them without a decode step
+            result = subprocess.run(cmd, capture_output=True, check=True)
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else str(e)
-            logger.error(f"Error fetching Twitter metadata: {error_msg}")
-            raise ValueError(f"Failed to get metadata for Twitter video: {error_msg}")
-        except json.JSONDecodeError:
-            logger.error("Failed to parse yt-dlp JSON output")
-            raise ValueError("Failed to parse video metadata")
-        except Exception as e:
-            logger.error(f"Unexpected error in get_metadata: {str(e)}")
+            e.stderr = e.stderr.decode("utf-8", "replace") if e.stderr else e.stderr
             raise
+        return _json_loads(result.stdout)
     
-    def download(self, url: str, format_id: Optional[str] = None, 
-                 progress_callback=None) -> str:
-        """Download a Twitter video."""
-        try:
-            tweet_id = self.extract_id_from_url(url)
-            output_template = os.path.join(self.download_dir, f"twitter-{tweet_id}.%(ext)s")
+    def _stream_info(self, cmd: List[str]) -> Dict[str, Any]:
+        """
+        Run a yt-dlp JSON dump and keep only the keys the downloaders use.
+        
+        The output is parsed as it arrives, so unused parts such as captions
+        are never built into Python objects.
+        
+        Args:
+            cmd: yt-dlp command that prints a single JSON document.
             
-            cmd = [
-                self.yt_dlp_path,
-                "--no-warnings",
-                "-o", output_template
-            ]
+        Returns:
+            The info dict, limited to the keys in ``_INFO_KEYS``.
             
-            if format_id:
-                cmd.extend(["-f", format_id])
-            else:
-                cmd.extend(["-f", "best"])
+        Raises:
+            subprocess.CalledProcessError: If the yt-dlp executable fails.
+            ijson.JSONError: If the output is not valid JSON.
+        """
+        # Spool stderr to a file so a chatty process can't block on a full pipe
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+            parse_error = None
+            try:
+                info = {
+                    key: value
+                    for key, value in ijson.kvitems(process.stdout, "", use_float=True)
+                    if key in _INFO_KEYS
+                }
+            except ijson.JSONError as e:
+                parse_error = e
+            finally:
+                process.stdout.close()
+                process.wait()
             
-            cmd.append(url)
+            # A failed run leaves truncated output, so report the process error first
+            if process.returncode != 0:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(
+                    process.returncode, cmd,
+                    stderr=stderr.read().decode("utf-8", "replace")
+                )
+            if parse_error is not None:
+                raise parse_error
+        
+        return info
+    
+    def _run_download(self, urls: List[str], cmd: List[str], opts: Dict[str, Any],
+                      progress_callback: Optional[Callable[[float], None]] = None,
+                      infos: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Download one or more URLs in a single yt-dlp run, reporting progress if requested.
+        
+        Args:
+            urls: The URLs of the videos.
+            cmd: Equivalent yt-dlp command, used when the package isn't installed.
+            opts: yt-dlp options for the in-process call.
+            progress_callback: Optional callback for progress updates.
+            infos: Optional list that receives the info dict of each downloaded video.
             
-            if self.simulation_mode:
-                logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
-                # Return a dummy file path in simulation mode
-                return os.path.join(self.download_dir, f"twitter-{tweet_id}.mp4")
+        Returns:
+            The final paths of the downloaded files, as reported by yt-dlp.
             
+        Raises:
+            subprocess.CalledProcessError: If the yt-dlp executable fails.
+            yt_dlp.utils.DownloadError: If the in-process download fails.
+        """
+        if YT_DLP_AVAILABLE:
+            hook = None
             if progress_callback:
-                # Run with progress updates
+                def hook(status: Dict[str, Any]) -> None:
+                    total = status.get("total_bytes") or status.get("total_bytes_estimate")
+                    if status.get("status") == "downloading" and total:
+                        progress_callback(status.get("downloaded_bytes", 0) * 100.0 / total)
+            
+            paths = []
+            with self._ydl(opts, hook) as ydl:
+                for url in urls:
+                    info = ydl.extract_info(url, download=True)
+                    if infos is not None:
+                        infos.append(info)
+                    downloads = info.get("requested_downloads")
+                    paths.append(
+                        downloads[-1]["filepath"] if downloads else ydl.prepare_filename(info)
+                    )
+            return paths
+        
+        # Have yt-dlp write each final path to a file instead of searching for it
+        fd, paths_file = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        cmd = [cmd[0], "--print-to-file", "after_move:filepath", paths_file, *cmd[1:]]
+        
+        info_file = None
+        if infos is not None:
+            # The info JSON goes to a file too, one line per video
+            fd, info_file = tempfile.mkstemp(suffix=".jsonl")
+            os.close(fd)
+            cmd[1:1] = ["--print-to-file", _INFO_PRINT_TEMPLATE, info_file]
+        
+        try:
+            if progress_callback:
+                # Run with progress updates, one structured line per update
+                cmd[1:1] = ["--newline", "--progress-template", _PROGRESS_TEMPLATE]
                 process = subprocess.Popen(
                     cmd, 
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    universal_newlines=True
+                    bufsize=1 << 16
                 )
+                fd = process.stdout.fileno()
+                _grow_pipe(fd)
                 
-                for line in process.stdout:
-                    if "download" in line.lower() and "%" in line:
-                        try:
-                            # Extract progress percentage
-                            match = re.search(r'(\d+\.\d+)%', line)
-                            if match:
-                                progress = float(match.group(1))
-                                progress_callback(progress)
-                        except Exception:
-                            # Continue even if progress parsing fails
-                            pass
+                # Read whatever is available in large chunks; only the latest
+                # complete progress line in each chunk is worth reporting
+                pending = b""
+                while True:
+                    chunk = os.read(fd, 1 << 16)
+                    if not chunk:
+                        break
+                    
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    for line in reversed(lines):
+                        if line.startswith(_PROGRESS_PREFIX):
+                            done, _, total = line[len(_PROGRESS_PREFIX):].partition(b"/")
+                            try:
+                                progress = float(done) * 100.0 / float(total)
+                            except (ValueError, ZeroDivisionError):
+                                # Size not known yet ("NA"); try an earlier line
+                                continue
+                            progress_callback(progress)
+                            break
                 
+                process.stdout.close()
                 process.wait()
                 if process.returncode != 0:
                     raise subprocess.CalledProcessError(process.returncode, cmd)
@@ -469,20 +1052,97 @@ class TwitterDownloader(BaseDownloader):
                 # Run without progress updates
                 subprocess.run(cmd, check=True, capture_output=True, text=True)
             
-            # Find the downloaded file
-            for file in os.listdir(self.download_dir):
-                if f"twitter-{tweet_id}" in file:
-                    return os.path.join(self.download_dir, file)
-            
-            raise ValueError("Downloaded file not found")
+            if info_file is not None:
+                with open(info_file, "rb") as f:
+                    infos.extend(_json_loads(line) for line in f if line.strip())
             
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else str(e)
-            logger.error(f"Error downloading Twitter video: {error_msg}")
-            raise ValueError(f"Failed to download Twitter video: {error_msg}")
-        except Exception as e:
-            logger.error(f"Unexpected error in download: {str(e)}")
-            raise
+            with open(paths_file, "r", encoding="utf-8") as f:
+                return [line.rstrip("\n") for line in f if line.strip()]
+        finally:
+            os.remove(paths_file)
+            if info_file is not None:
+                os.remove(info_file)
+
+
+class YouTubeDownloader(_YtDlpBackend):
+    """Downloader for YouTube videos using yt-dlp."""
+    
+    PLATFORM_NAME = "youtube"
+    DISPLAY_NAME = "YouTube"
+    URL_PATTERNS = [_YT_URL_RE]
+    HOST_PATTERN = r'youtube\.com|youtube-nocookie\.com|youtu\.be'
+    FILENAME_TEMPLATE = "%(title)s-{id}.%(ext)s"
+    FILE_MARKER = "{id}"
+    SIMULATION_FILENAME = "simulation-video-{id}.mp4"
+    NO_PLAYLIST = True
+    
+    def extract_id_from_url(self, url: str) -> str:
+        """Extract the video ID from a YouTube URL."""
+        return _extract_youtube_id(url)
+    
+    def _simulation_metadata(self, video_id: str, url: str) -> VideoMetadata:
+        """Build dummy metadata for a YouTube video."""
+        return VideoMetadata(
+            video_id=video_id,
+            title="Simulation Video",
+            author="Simulation Channel",
+            duration=180.0,
+            thumbnail_url="https://example.com/thumbnail.jpg",
+            platform=self.PLATFORM_NAME,
+            formats=[
+                {"format_id": "22", "ext": "mp4", "resolution": "720p", 
+                 "filesize": 1024*1024*10}
+            ],
+            original_url=url
+        )
+
+
+class TwitterDownloader(_YtDlpBackend):
+    """Downloader for Twitter videos."""
+    
+    PLATFORM_NAME = "twitter"
+    DISPLAY_NAME = "Twitter"
+    URL_PATTERNS = [_TW_URL_RE]
+    HOST_PATTERN = r'twitter\.com|x\.com'
+    FILENAME_TEMPLATE = "twitter-{id}.%(ext)s"
+    FILE_MARKER = "twitter-{id}"
+    SIMULATION_FILENAME = "twitter-{id}.mp4"
+    UNKNOWN_AUTHOR = "Unknown User"
+    NO_PLAYLIST = False
+    
+    def extract_id_from_url(self, url: str) -> str:
+        """Extract the tweet ID from a Twitter URL."""
+        return _extract_tweet_id(url)
+    
+    def _simulation_metadata(self, video_id: str, url: str) -> VideoMetadata:
+        """Build dummy metadata for a Twitter video."""
+        return VideoMetadata(
+            video_id=video_id,
+            title=f"Twitter Video {video_id}",
+            author="Twitter User",
+            duration=60.0,
+            thumbnail_url="https://example.com/twitter_thumbnail.jpg",
+            platform=self.PLATFORM_NAME,
+            formats=[
+                {"format_id": "best", "ext": "mp4", "resolution": "720p", 
+                 "filesize": 1024*1024*5}
+            ],
+            original_url=url
+        )
+    
+    def _title_from_info(self, info: Dict[str, Any], video_id: str) -> str:
+        """Get a title for a tweet's video, which often has none of its own."""
+        # Twitter videos often don't have proper titles, create one from tweet text
+        title = info.get('title', '').strip()
+        if not title or title == "Twitter":
+            # Try to create a title from description or just use tweet ID
+            desc = info.get('description', '')
+            if desc:
+                # Use first 50 chars of description as title
+                title = desc[:50] + ('...' if len(desc) > 50 else '')
+            else:
+                title = f"Twitter Video {video_id}"
+        return title
 
 
 class DownloaderFactory:
@@ -493,6 +1153,57 @@ class DownloaderFactory:
         "twitter": TwitterDownloader,
     }
     
+    # Combined host regex classifying a URL in one match, and its group -> platform map
+    _platform_re: ClassVar[Optional[re.Pattern]] = None
+    _platform_groups: ClassVar[Dict[str, str]] = {}
+    
+    @classmethod
+    def _build_platform_re(cls) -> None:
+        """Rebuild the combined host regex from the registered downloaders."""
+        alternatives = []
+        groups = {}
+        for index, (platform, downloader_class) in enumerate(cls._downloaders.items()):
+            host_pattern = getattr(downloader_class, "HOST_PATTERN", None)
+            if host_pattern:
+                group = f"p{index}"
+                alternatives.append(f"(?P<{group}>{host_pattern})")
+                groups[group] = platform
+        
+        cls._platform_re = re.compile(
+            r'^(?:https?://)?(?:[\w-]+\.)*(?:' + "|".join(alternatives) + r')(?:[:/?#]|$)',
+            re.IGNORECASE
+        ) if alternatives else None
+        cls._platform_groups = groups
+    
+    @classmethod
+    def classify(cls, url: str) -> Optional[str]:
+        """
+        Find the platform of a URL without creating a downloader.
+        
+        Args:
+            url: The URL to classify.
+            
+        Returns:
+            The platform identifier, or None if no downloader supports the URL.
+        """
+        if cls._platform_re is None and cls._downloaders:
+            cls._build_platform_re()
+        
+        if cls._platform_re is not None:
+            match = cls._platform_re.match(url)
+            if match:
+                return cls._platform_groups[match.lastgroup]
+        
+        # Downloaders registered without a HOST_PATTERN are matched on their URL patterns
+        for platform, downloader_class in cls._downloaders.items():
+            if platform in cls._platform_groups.values():
+                continue
+            for pattern in downloader_class.URL_PATTERNS:
+                if re.match(pattern, url):
+                    return platform
+        
+        return None
+    
     @classmethod
     def create_downloader(cls, url: str, download_dir: Optional[str] = None) -> BaseDownloader:
         """
@@ -508,25 +1219,55 @@ class DownloaderFactory:
         Raises:
             ValueError: If no downloader is available for the URL.
         """
-        # Try to match URL against known patterns
-        for platform, downloader_class in cls._downloaders.items():
-            for pattern in downloader_class.URL_PATTERNS:
-                if re.match(pattern, url):
-                    return downloader_class(download_dir)
+        platform = cls.classify(url)
+        if platform is None:
+            raise ValueError(f"No downloader available for URL: {url}")
         
-        # If no pattern matched, try to parse and check domain
-        try:
-            domain = urlparse(url).netloc.lower()
+        return cls._downloaders[platform](download_dir)
+    
+    @classmethod
+    def download_many(cls, urls: List[str], download_dir: Optional[str] = None,
+                      format_id: Optional[str] = None,
+                      progress_callback: Optional[Callable[[float], None]] = None) -> List[str]:
+        """
+        Download several videos, running yt-dlp once per platform.
+        
+        Args:
+            urls: The URLs of the videos to download.
+            download_dir: Optional directory to save downloaded files.
+            format_id: Optional format ID to download. If None, uses best quality.
+            progress_callback: Optional callback receiving overall progress.
             
-            if "youtube" in domain or "youtu.be" in domain:
-                return cls._downloaders["youtube"](download_dir)
+        Returns:
+            The paths to the downloaded files, in the same order as ``urls``.
+            
+        Raises:
+            ValueError: If a URL is unsupported or a download fails.
+        """
+        # Group URLs by downloader class, keeping their original positions
+        groups: Dict[type, Tuple[BaseDownloader, List[int]]] = {}
+        for index, url in enumerate(urls):
+            downloader = cls.create_downloader(url, download_dir)
+            groups.setdefault(type(downloader), (downloader, []))[1].append(index)
+        
+        paths: List[Optional[str]] = [None] * len(urls)
+        done = 0
+        for downloader, indices in groups.values():
+            group_callback = None
+            if progress_callback:
+                # Scale each group's progress to its share of all URLs
+                def group_callback(progress: float, offset: int = done,
+                                   size: int = len(indices)) -> None:
+                    progress_callback((offset * 100.0 + progress * size) / len(urls))
             
-            if "twitter" in domain or "x.com" in domain:
-                return cls._downloaders["twitter"](download_dir)
-        except Exception:
-            pass
+            group_paths = downloader.download_many(
+                [urls[index] for index in indices], format_id, group_callback
+            )
+            for index, path in zip(indices, group_paths):
+                paths[index] = path
+            done += len(indices)
         
-        raise ValueError(f"No downloader available for URL: {url}")
+        return paths
     
     @classmethod
     def register_downloader(cls, platform: str, downloader_class: type) -> None:
@@ -538,23 +1279,25 @@ class DownloaderFactory:
             downloader_class: The downloader class to register.
         """
         cls._downloaders[platform] = downloader_class
+        cls._build_platform_re()
+        is_supported_url.cache_clear()
 
 
+@functools.lru_cache(maxsize=4096)
 def is_supported_url(url: str) -> bool:
     """
     Check if a URL is supported by any registered downloader.
     
+    Only the URL is classified; no downloader is created. Results are cached
+    per URL until another downloader is registered.
+    
     Args:
         url: The URL to check.
         
     Returns:
         True if the URL is supported, False otherwise.
     """
-    try:
-        DownloaderFactory.create_downloader(url)
-        return True
-    except ValueError:
-        return False
+    return DownloaderFactory.classify(url) is not None
 
 
 if __name__ == "__main__":
@@ -588,7 +1331,7 @@ if __name__ == "__main__":
                   f"Size: {fmt.get('filesize', 'Unknown')}")
         
         print("\nDownloading video...")
-        output_path = downloader.download(url)
+        output_path = downloader.download(url, video_id=metadata.video_id)
         print(f"Video downloaded to: {output_path}")
         
     except ValueError as e:
@@ -6,15 +6,28 @@ while preserving pitch, adding reverb, and other effects.
 """
 
 import os
+import re
+import sys
+import math
 import logging
+import functools
 import tempfile
+import threading
 import subprocess
 import json
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Callable, List, Tuple, Union
 
+# When run as a script, keep numba's compiled kernels in a per-user cache that
+# survives between runs; this has to happen before numba is first imported
+if __name__ == "__main__":
+    os.environ.setdefault(
+        "NUMBA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "slowjams", "numba")
+    )
+
 # Try to import optional libraries
 try:
     import librosa
@@ -24,6 +37,13 @@ try:
 except ImportError:
     LIBROSA_AVAILABLE = False
 
+# Compile the sample-level kernels when numba is installed
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Import from core package
 try:
     from core.converter import AudioConverter, AudioFormat, ConversionOptions
@@ -44,6 +64,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=...) is only accepted from Python 3.10 onwards
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class EffectType(Enum):
     """Types of audio effects supported by the processor."""
@@ -56,7 +79,7 @@ class EffectType(Enum):
     NOISE_REDUCTION = auto()  # Reduce background noise
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProcessingOptions:
     """Options for audio processing effects."""
     
@@ -66,6 +89,7 @@ class ProcessingOptions:
     output_bitrate: str = "320k"
     normalize_output: bool = True
     preserve_metadata: bool = True
+    encoder_flags: List[str] = field(default_factory=list)  # Extra FFmpeg output options
     
     # Slow effect options
     slow_factor: float = 0.8  # Speed factor (0.5 = half speed, 2.0 = double speed)
@@ -142,6 +166,439 @@ class ProcessingOptions:
         )
 
 
+# Encoder arguments for each output format
+_CODEC_ARGS: Dict[AudioFormat, Callable[[ProcessingOptions], List[str]]] = {
+    AudioFormat.MP3: lambda o: ["-c:a", "libmp3lame", "-b:a", o.output_bitrate],
+    AudioFormat.FLAC: lambda o: ["-c:a", "flac"],
+    AudioFormat.WAV: lambda o: ["-c:a", "pcm_s16le"],
+    AudioFormat.AAC: lambda o: ["-c:a", "aac", "-b:a", o.output_bitrate],
+    AudioFormat.OGG: lambda o: ["-c:a", "libvorbis", "-b:a", o.output_bitrate],
+}
+
+
+# Output path that streams the encoded audio to stdout instead of a file
+_STDOUT_PATH = "-"
+
+# Muxer for each output format when there's no file extension to infer it from
+_PIPE_MUXERS: Dict[AudioFormat, str] = {
+    AudioFormat.MP3: "mp3",
+    AudioFormat.FLAC: "flac",
+    AudioFormat.WAV: "wav",
+    AudioFormat.AAC: "adts",
+    AudioFormat.OGG: "ogg",
+}
+
+
+def _output_args(output_path: str, output_format: AudioFormat) -> List[str]:
+    """Get FFmpeg's output arguments, streaming to stdout for ``_STDOUT_PATH``."""
+    if output_path == _STDOUT_PATH:
+        return ["-f", _PIPE_MUXERS[output_format], "pipe:1"]
+    return [output_path]
+
+
+# Speed factors this close to 1.0 are treated as leaving the speed unchanged
+_IDENTITY_TOLERANCE = 1e-6
+
+
+def _is_identity(options: ProcessingOptions) -> bool:
+    """Check whether processing options leave the audio itself unchanged."""
+    return (abs(options.slow_factor - 1.0) < _IDENTITY_TOLERANCE
+            and not options.reverb_enabled
+            and not (options.pitch_enabled and options.pitch_semitones != 0.0)
+            and not (options.volume_enabled and options.volume_gain_db != 0.0)
+            and not (options.equalizer_enabled and options.equalizer_bands)
+            and not options.chorus_enabled
+            and not options.noise_reduction_enabled
+            and not options.normalize_output
+            and not options.encoder_flags)
+
+
+@functools.lru_cache(maxsize=4)
+def _ffmpeg_filters(ffmpeg_path: str) -> Optional[frozenset]:
+    """
+    List the filters an FFmpeg build provides; probed once per executable.
+    
+    Args:
+        ffmpeg_path: Path to the FFmpeg executable.
+        
+    Returns:
+        The filter names, or None if FFmpeg couldn't be queried.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-filters"],
+            capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    
+    # Filter lines look like " T.. rubberband        A->A       Apply time-stretching..."
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split(None, 3)
+        if len(parts) >= 3 and "->" in parts[2]:
+            names.add(parts[1])
+    return frozenset(names)
+
+
+def _has_filter(ffmpeg_path: str, name: str) -> bool:
+    """Check whether an FFmpeg build provides a filter."""
+    filters = _ffmpeg_filters(ffmpeg_path)
+    return filters is not None and name in filters
+
+
+def _can_use_filter(ffmpeg_path: str, name: str) -> bool:
+    """Check that a filter isn't known to be missing from an FFmpeg build."""
+    # If the build couldn't be probed, let FFmpeg itself report a missing filter
+    filters = _ffmpeg_filters(ffmpeg_path)
+    return filters is None or name in filters
+
+
+# Threads for FFmpeg's filter graphs; half the cores leaves room for the codec
+_FILTER_THREADS = max(1, (os.cpu_count() or 1) // 2)
+
+# Formats libsndfile decodes itself, sparing an FFmpeg process and pipe
+_SOUNDFILE_EXTENSIONS = frozenset((".wav", ".flac", ".ogg", ".aif", ".aiff"))
+
+# Decodes expected to exceed this many samples (256 MB) go to a file-backed
+# buffer, so the kernel can page them out rather than pin them in memory
+_MMAP_DECODE_SAMPLES = 1 << 26
+
+# Keep FFmpeg's stderr down to actual errors when it isn't parsed for progress
+_QUIET_ARGS = ("-hide_banner", "-loglevel", "error", "-nostats")
+
+# EBU R128 loudness target for normalization in the FFmpeg-only path
+_LOUDNORM = "loudnorm=I=-16:LRA=11:TP=-1.5"
+
+# Position in FFmpeg's progress output, as HH:MM:SS.ss
+_TIME_RE = re.compile(rb"time=(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+# Peak level normalization scales the output to, leaving headroom against clipping
+_NORMALIZE_HEADROOM = 0.95
+# Scale factors closer to 1.0 than this are inaudible even at 16 bits, so skipped
+_SCALE_TOLERANCE = 1e-6
+# Numba's default threading layer aborts when a parallel kernel is entered from
+# several threads at once, so concurrent renders take turns at _normalize_gain
+_NORMALIZE_LOCK = threading.Lock()
+
+
+def _normalize_gain_np(y: np.ndarray, gain_factor: float, normalize: bool,
+                       headroom: float) -> np.ndarray:
+    """
+    Apply a gain and optional peak normalization to samples in place.
+    
+    Args:
+        y: Audio samples, modified in place.
+        gain_factor: Linear gain to apply.
+        normalize: Whether to scale the peak of the gained signal to ``headroom``.
+        headroom: Target peak level for normalization.
+        
+    Returns:
+        The scaled samples.
+    """
+    # The peak magnitude from the extremes, without an abs() temporary
+    peak = max(float(y.max()), -float(y.min())) * gain_factor if normalize and y.size else 0.0
+    if normalize and peak == 0:
+        # Silence stays silent whatever the gain
+        return y
+    
+    scale = headroom / peak * gain_factor if peak > 0 else gain_factor
+    if abs(scale - 1.0) > _SCALE_TOLERANCE:
+        y *= scale
+    return y
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _normalize_gain(y, gain_factor, normalize, headroom):
+        """
+        Apply a gain and optional peak normalization in two parallel passes.
+        
+        The scaling pass is skipped when it wouldn't change any samples, as
+        for silent segments or audio already peaking at the target level.
+        """
+        peak = 0.0
+        if normalize:
+            for i in prange(y.shape[0]):
+                peak = max(peak, abs(y[i]))
+            if peak == 0.0:
+                return y
+            peak *= gain_factor
+        
+        scale = headroom / peak * gain_factor if peak > 0 else gain_factor
+        if abs(scale - 1.0) > _SCALE_TOLERANCE:
+            for i in prange(y.shape[0]):
+                y[i] = y[i] * scale
+        return y
+else:
+    _normalize_gain = _normalize_gain_np
+
+
+# WSOLA time stretching: frame length, how far to search for the best-matching
+# frame, samples compared per candidate, and the speed factors it's used for
+_WSOLA_FRAME = 2048
+_WSOLA_TOLERANCE = 256
+_WSOLA_CORRELATION = 512
+_WSOLA_MIN_RATE = 0.5
+_WSOLA_MAX_RATE = 1.5
+
+if NUMBA_AVAILABLE:
+    @njit(nogil=True, fastmath=True, cache=True)
+    def _wsola(y, rate, frame, tolerance, correlation):
+        """
+        Time-stretch mono audio with WSOLA, preserving pitch.
+        
+        Hann-windowed frames are overlap-added at half a frame apart. Each
+        frame is taken from within ``tolerance`` samples of its nominal input
+        position, wherever it best matches the continuation of the previous one.
+        
+        Args:
+            y: Mono float32 samples.
+            rate: Speed factor; below 1.0 slows the audio down.
+            frame: Frame length in samples.
+            tolerance: Search radius around each nominal position.
+            correlation: Samples compared per candidate position.
+            
+        Returns:
+            The stretched samples, ``len(y) / rate`` long.
+        """
+        hop = frame // 2
+        n = y.shape[0]
+        out_len = int(n / rate)
+        frames = out_len // hop + 2
+        
+        # Leading silence lets the first frame start before the signal does
+        offset = tolerance + 2 * hop
+        padded = np.zeros(offset + n + 2 * frame + 2 * tolerance, dtype=np.float32)
+        padded[offset:offset + n] = y
+        last_start = padded.shape[0] - frame
+        
+        window = np.empty(frame, dtype=np.float32)
+        for i in range(frame):
+            window[i] = 0.5 - 0.5 * np.cos(2.0 * np.pi * i / frame)
+        
+        out = np.zeros(frames * hop + frame, dtype=np.float32)
+        previous = offset - hop
+        for k in range(frames):
+            nominal = offset + int((k - 1) * hop * rate)
+            position = min(nominal, last_start)
+            if k > 0:
+                # Natural continuation of the previous frame
+                target = previous + hop
+                best = -np.inf
+                for candidate in range(max(nominal - tolerance, 0),
+                                       min(nominal + tolerance, last_start) + 1):
+                    score = 0.0
+                    for i in range(correlation):
+                        score += padded[candidate + i] * padded[target + i]
+                    if score > best:
+                        best = score
+                        position = candidate
+            
+            start = k * hop
+            for i in range(frame):
+                out[start + i] += window[i] * padded[position + i]
+            previous = position
+        
+        # Drop the lead-in frame's half, which covered the leading silence
+        return out[hop:hop + out_len].copy()
+
+
+# Partition length of the convolution reverb; each FFT covers two partitions
+_REVERB_BLOCK = 1024
+# Input blocks transformed per batch, bounding the spectra held in memory
+_REVERB_BATCH = 256
+
+
+@functools.lru_cache(maxsize=16)
+def _reverb_partitions(sr: int, room_size: float, damping: float) -> np.ndarray:
+    """
+    Synthesize a reverb impulse response and return its partition spectra.
+    
+    The response is exponentially decaying noise whose length grows with the
+    room size; damping makes high frequencies die away faster than lows.
+    
+    Args:
+        sr: Sample rate in Hz.
+        room_size: Room size from 0.0 to 1.0.
+        damping: High-frequency damping from 0.0 to 1.0.
+        
+    Returns:
+        Read-only array of shape (partitions, _REVERB_BLOCK + 1) holding the
+        spectrum of each _REVERB_BLOCK-sample slice of the response.
+    """
+    block = _REVERB_BLOCK
+    rt60 = 0.2 + 1.8 * min(max(room_size, 0.0), 1.0)  # seconds to decay by 60 dB
+    length = max(block, int(rt60 * sr))
+    partitions = -(-length // block)
+    
+    t = np.arange(partitions * block, dtype=np.float32) / sr
+    rng = np.random.default_rng(0)
+    h = rng.standard_normal(partitions * block).astype(np.float32)
+    h *= np.exp(-6.9 * t / rt60).astype(np.float32)
+    h /= np.sqrt(np.sum(h * h))
+    
+    spectra = np.fft.rfft(h.reshape(partitions, block), n=2 * block, axis=1)
+    
+    # Later partitions lose progressively more of their high frequencies
+    freqs = np.linspace(0.0, 1.0, block + 1, dtype=np.float32)
+    ages = np.linspace(0.0, 1.0, partitions, dtype=np.float32)[:, None]
+    spectra *= np.exp(-4.0 * min(max(damping, 0.0), 1.0) * ages * freqs)
+    
+    spectra = spectra.astype(np.complex64)
+    spectra.flags.writeable = False
+    return spectra
+
+
+def _apply_reverb_np(y: np.ndarray, sr: int, options: 'ProcessingOptions') -> np.ndarray:
+    """
+    Add reverb to mono audio with uniformly partitioned FFT convolution.
+    
+    Uses overlap-save: each block of input is transformed once, and its
+    spectrum is multiplied with every partition of the impulse response as
+    it moves through a frequency-domain delay line.
+    
+    Args:
+        y: Mono audio samples.
+        sr: Sample rate in Hz.
+        options: Processing options with the reverb settings.
+        
+    Returns:
+        The dry and reverberated signals mixed, with the same length as ``y``.
+    """
+    block = _REVERB_BLOCK
+    H = _reverb_partitions(sr, round(options.reverb_room_size, 3),
+                           round(options.reverb_damping, 3))
+    partitions = H.shape[0]
+    
+    n = len(y)
+    blocks = -(-n // block)
+    
+    # One block of leading silence, so every frame is [previous block, current block]
+    x = np.zeros((blocks + 1) * block, dtype=np.float32)
+    x[block:block + n] = y
+    frames = np.lib.stride_tricks.as_strided(
+        x, shape=(blocks, 2 * block), strides=(block * x.itemsize, x.itemsize)
+    )
+    
+    wet = np.empty(blocks * block, dtype=np.float32)
+    history = np.zeros((partitions - 1, block + 1), dtype=np.complex64)
+    
+    for start in range(0, blocks, _REVERB_BATCH):
+        X = np.fft.rfft(frames[start:start + _REVERB_BATCH], axis=1).astype(np.complex64)
+        count = len(X)
+        
+        # Row j of the delay line is the spectrum of block start - (partitions - 1) + j
+        line = np.concatenate((history, X))
+        Y = np.zeros_like(X)
+        for k in range(partitions):
+            offset = partitions - 1 - k
+            Y += line[offset:offset + count] * H[k]
+        
+        # Overlap-save: the first half of each inverse transform is aliased
+        wet[start * block:(start + count) * block] = (
+            np.fft.irfft(Y, n=2 * block, axis=1)[:, block:].ravel()
+        )
+        history = line[count:]
+    
+    return options.reverb_dry_level * y + options.reverb_wet_level * wet[:n]
+
+
+# Bandwidth of each equalizer band in Hz
+_EQ_WIDTH = 200.0
+# Equalizer filter with the constant bandwidth part already filled in
+_EQ_FILTER = "equalizer=f={:g}:width_type=h:width=" + f"{_EQ_WIDTH:g}" + ":g={:g}"
+
+
+def _eq_bands_key(bands: Dict[str, float]) -> Tuple[Tuple[float, float], ...]:
+    """Turn equalizer bands into a hashable key, ordered by frequency."""
+    return tuple(sorted((float(band), float(gain)) for band, gain in bands.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _eq_filter_str(bands: Tuple[Tuple[float, float], ...]) -> str:
+    """Build the FFmpeg equalizer chain for a band key from ``_eq_bands_key``."""
+    # Peaking filters are linear and time-invariant, so their order doesn't matter
+    return ",".join([_EQ_FILTER.format(freq, gain) for freq, gain in bands])
+
+
+@functools.lru_cache(maxsize=32)
+def _atempo_chain(factor: float) -> str:
+    """Build the atempo chain for a speed factor, staged to fit atempo's 0.5-2.0 range."""
+    # Split large changes into the fewest equal stages that each stay in range
+    stages = max(1, math.ceil(abs(math.log2(factor)) - 1e-9))
+    return ",".join([f"atempo={factor ** (1.0 / stages):.6f}"] * stages)
+
+
+@functools.lru_cache(maxsize=32)
+def _chorus_filter(depth: float, rate: float, delay: float) -> str:
+    """Build the chorus filter for a depth, LFO rate and delay in seconds."""
+    return f"chorus=0.5:{depth}:{rate}:{delay * 1000}:0.5:0.5"
+
+
+@functools.lru_cache(maxsize=32)
+def _eq_coefficients(bands: Tuple[Tuple[float, float], ...], sr: int) -> np.ndarray:
+    """
+    Compute normalized biquad coefficients for each equalizer band.
+    
+    Uses the same peaking filter design as FFmpeg's ``equalizer`` filter, so
+    the in-process EQ matches the filter chain it replaces.
+    
+    Args:
+        bands: Band key from ``_eq_bands_key``.
+        sr: Sample rate in Hz.
+        
+    Returns:
+        A read-only array with one ``(b0, b1, b2, a1, a2)`` row per band.
+    """
+    coefficients = np.empty((len(bands), 5))
+    for row, (freq, gain) in zip(coefficients, bands):
+        w0 = 2.0 * math.pi * freq / sr
+        alpha = math.sin(w0) * _EQ_WIDTH / (2.0 * freq)
+        A = 10 ** (gain / 40.0)
+        a0 = 1.0 + alpha / A
+        row[:] = (
+            (1.0 + alpha * A) / a0,
+            -2.0 * math.cos(w0) / a0,
+            (1.0 - alpha * A) / a0,
+            -2.0 * math.cos(w0) / a0,
+            (1.0 - alpha / A) / a0,
+        )
+    coefficients.flags.writeable = False
+    return coefficients
+
+
+if NUMBA_AVAILABLE:
+    @njit(nogil=True, fastmath=True, cache=True)
+    def _biquad_cascade(y, coefficients):
+        """
+        Run samples through a cascade of biquads in place, in a single pass.
+        
+        Each stage is a transposed direct form II section, so the whole
+        cascade only needs two state variables per band.
+        
+        Args:
+            y: Mono float32 samples, modified in place.
+            coefficients: One ``(b0, b1, b2, a1, a2)`` row per stage.
+            
+        Returns:
+            The filtered samples.
+        """
+        stages = coefficients.shape[0]
+        z1 = np.zeros(stages)
+        z2 = np.zeros(stages)
+        for i in range(y.shape[0]):
+            x = np.float64(y[i])
+            for k in range(stages):
+                out = coefficients[k, 0] * x + z1[k]
+                z1[k] = coefficients[k, 1] * x - coefficients[k, 3] * out + z2[k]
+                z2[k] = coefficients[k, 2] * x - coefficients[k, 4] * out
+                x = out
+            y[i] = x
+        return y
+
+
 class AudioProcessor:
     """
     Class for processing audio with various effects.
@@ -159,11 +616,12 @@ class AudioProcessor:
             ffprobe_path: Path to the FFprobe executable. If None, assumes it's in PATH.
             temp_dir: Directory for temporary files. If None, uses system temp dir.
         """
-        self.ffmpeg_path = ffmpeg_path or "ffmpeg"
-        self.ffprobe_path = ffprobe_path or "ffprobe"
+        self.converter = AudioConverter(ffmpeg_path, ffprobe_path, temp_dir)
+        # Share the converter's executables, already resolved against PATH once
+        self.ffmpeg_path = self.converter.ffmpeg_path
+        self.ffprobe_path = self.converter.ffprobe_path
         self.temp_dir = temp_dir or tempfile.gettempdir()
         self.simulation_mode = get_bool_env("SIMULATION_MODE", False)
-        self.converter = AudioConverter(ffmpeg_path, ffprobe_path, temp_dir)
         
         # Log whether librosa is available
         if LIBROSA_AVAILABLE:
@@ -179,7 +637,8 @@ class AudioProcessor:
         
         Args:
             input_path: Path to the input audio file.
-            output_path: Path for the output audio file. If None, generates one.
+            output_path: Path for the output audio file, or "-" to stream the
+                encoded audio to stdout. If None, generates one.
             options: Processing options. If None, uses defaults.
             progress_callback: Optional callback for progress updates.
             
@@ -190,7 +649,10 @@ class AudioProcessor:
             ValueError: If the input file doesn't exist or processing fails.
             FileNotFoundError: If required executables are not found.
         """
-        if not os.path.exists(input_path):
+        # One stat both checks the input and keys the metadata probe's cache
+        try:
+            st = os.stat(input_path)
+        except FileNotFoundError:
             raise ValueError(f"Input audio file not found: {input_path}")
         
         options = options or ProcessingOptions()
@@ -208,10 +670,26 @@ class AudioProcessor:
         original_metadata = None
         if options.preserve_metadata:
             try:
-                original_metadata = self.converter.get_metadata(input_path)
+                original_metadata = self.converter.get_metadata(input_path, st)
             except Exception as e:
                 logger.warning(f"Failed to read original metadata: {str(e)}")
         
+        # With no effects to apply this is just a conversion, which can often
+        # copy the input's audio rather than decode and re-encode it
+        if (_is_identity(options) and output_path != _STDOUT_PATH and original_metadata
+                and original_metadata.sample_rate and original_metadata.channels):
+            logger.info("No effects to apply, converting without processing")
+            return self.converter.convert_audio(
+                input_path, output_path,
+                ConversionOptions(
+                    format=options.output_format,
+                    bitrate=options.output_bitrate,
+                    sample_rate=original_metadata.sample_rate,
+                    channels=original_metadata.channels
+                ),
+                progress_callback
+            )
+        
         # Choose processing method based on options and available libraries
         if options.slow_factor != 1.0 and options.preserve_pitch and LIBROSA_AVAILABLE:
             # Use librosa for high-quality time stretching with pitch preservation
@@ -244,152 +722,156 @@ class AudioProcessor:
         if self.simulation_mode:
             logger.info("Simulation mode: Would process audio with librosa")
             # Create a small dummy audio file in simulation mode
-            with open(output_path, "wb") as f:
-                f.write(b"\0" * 1024)  # 1KB dummy file
+            if output_path != _STDOUT_PATH:
+                with open(output_path, "wb") as f:
+                    f.write(b"\0" * 1024)  # 1KB dummy file
             return output_path
         
+        # Set once the encoder may have written to an inherited stdout
+        streamed = False
         try:
             # Load audio file with progress reporting
             if progress_callback:
                 progress_callback(0.0)
                 logger.info(f"Loading audio file: {input_path}")
             
-            # Load audio with librosa
-            y, sr = librosa.load(input_path, sr=None, mono=True)
+            # Decode straight to mono float32, in-process where libsndfile can
+            loaded = None
+            if os.path.splitext(input_path)[1].lower() in _SOUNDFILE_EXTENSIONS:
+                loaded = self._load_f32_via_soundfile(input_path)
+            y, sr = loaded or self._load_f32_via_ffmpeg(input_path, original_metadata)
+            
+            # Read the options once; the samples stay contiguous float32 throughout
+            slow = float(options.slow_factor)
+            pitch_n = float(options.pitch_semitones) if options.pitch_enabled else 0.0
+            gain_db = float(options.volume_gain_db) if options.volume_enabled else 0.0
+            normalize = options.normalize_output
             
             if progress_callback:
                 progress_callback(10.0)
                 logger.info("Audio loaded, applying effects")
             
             # Apply slow effect (time stretching)
-            if options.slow_factor != 1.0:
-                # Time stretching with pitch preservation
-                y = librosa.effects.time_stretch(y, rate=options.slow_factor)
+            if slow != 1.0:
+                # Time stretching with pitch preservation; WSOLA is much faster
+                # than librosa's phase vocoder for moderate factors
+                if (NUMBA_AVAILABLE and len(y) >= 2 * _WSOLA_FRAME and
+                        _WSOLA_MIN_RATE <= slow <= _WSOLA_MAX_RATE):
+                    y = _wsola(y, slow, _WSOLA_FRAME, _WSOLA_TOLERANCE, _WSOLA_CORRELATION)
+                else:
+                    y = np.ascontiguousarray(
+                        librosa.effects.time_stretch(y, rate=slow), dtype=np.float32
+                    )
                 
                 if progress_callback:
                     progress_callback(40.0)
-                    logger.info(f"Applied time stretching with factor {options.slow_factor}")
+                    logger.info(f"Applied time stretching with factor {slow}")
             
             # Apply pitch shifting if enabled
-            if options.pitch_enabled and options.pitch_semitones != 0.0:
-                y = librosa.effects.pitch_shift(y, sr=sr, n_steps=options.pitch_semitones)
+            if pitch_n != 0.0:
+                y = np.ascontiguousarray(
+                    librosa.effects.pitch_shift(y, sr=sr, n_steps=pitch_n), dtype=np.float32
+                )
                 
                 if progress_callback:
                     progress_callback(60.0)
-                    logger.info(f"Applied pitch shifting of {options.pitch_semitones} semitones")
+                    logger.info(f"Applied pitch shifting of {pitch_n} semitones")
             
-            # Apply volume adjustment if enabled
-            if options.volume_enabled and options.volume_gain_db != 0.0:
-                gain_factor = 10 ** (options.volume_gain_db / 20.0)
-                y = y * gain_factor
+            # Apply reverb in-process rather than as an FFmpeg echo
+            if options.reverb_enabled:
+                y = _apply_reverb_np(y, sr, options)
                 
                 if progress_callback:
-                    progress_callback(70.0)
-                    logger.info(f"Applied volume gain of {options.volume_gain_db} dB")
-            
-            # Normalize output if requested
-            if options.normalize_output:
-                max_val = np.max(np.abs(y))
-                if max_val > 0:
-                    y = y / max_val * 0.95  # 95% of maximum to avoid clipping
+                    progress_callback(65.0)
+                    logger.info("Applied reverb")
+            
+            # Apply volume adjustment and normalization in a single sweep
+            if gain_db != 0.0 or normalize:
+                gain_factor = 10 ** (gain_db / 20.0)
+                with _NORMALIZE_LOCK:
+                    y = _normalize_gain(y, gain_factor, normalize, _NORMALIZE_HEADROOM)
                 
                 if progress_callback:
                     progress_callback(80.0)
-                    logger.info("Applied normalization")
+                    if gain_db != 0.0:
+                        logger.info(f"Applied volume gain of {gain_db} dB")
+                    if normalize:
+                        logger.info("Applied normalization")
             
-            # Save processed audio to a temporary WAV file
-            temp_wav_path = os.path.join(self.temp_dir, "temp_processed.wav")
-            sf.write(temp_wav_path, y, sr)
+            # Apply the equalizer bands as one fused biquad cascade
+            eq_bands = ()
+            if options.equalizer_enabled and options.equalizer_bands:
+                eq_bands = _eq_bands_key(options.equalizer_bands)
+                if NUMBA_AVAILABLE:
+                    y = _biquad_cascade(y, _eq_coefficients(eq_bands, sr))
+                    logger.info(f"Applied {len(eq_bands)}-band equalizer")
             
             if progress_callback:
                 progress_callback(90.0)
-                logger.info("Saved processed audio, applying final conversion")
-            
-            # Convert to final format with FFmpeg to apply any remaining effects
-            # and ensure proper format and metadata
-            conv_options = ConversionOptions(
-                format=options.output_format,
-                bitrate=options.output_bitrate,
-                metadata=original_metadata.to_ffmpeg_metadata() if original_metadata else None
-            )
+                logger.info("Effects applied, encoding with FFmpeg")
             
-            # Apply reverb and other effects during the final conversion
-            if (options.reverb_enabled or 
-                options.chorus_enabled or 
-                options.equalizer_enabled or 
-                options.noise_reduction_enabled):
-                
-                # Build FFmpeg filter chain for remaining effects
-                filters = []
-                
-                # Add reverb filter
-                if options.reverb_enabled:
-                    reverb_filter = (
-                        f"aecho=0.8:{options.reverb_room_size * 1000}:"
-                        f"{options.reverb_damping * 1000}:{options.reverb_wet_level}"
-                    )
-                    filters.append(reverb_filter)
-                
-                # Add chorus filter
-                if options.chorus_enabled:
-                    chorus_filter = (
-                        f"chorus=0.5:{options.chorus_depth}:"
-                        f"{options.chorus_rate}:{options.chorus_delay * 1000}:0.5:0.5"
-                    )
-                    filters.append(chorus_filter)
-                
-                # Add equalizer filter
-                if options.equalizer_enabled and options.equalizer_bands:
-                    eq_parts = []
-                    for band, gain in options.equalizer_bands.items():
-                        eq_parts.append(f"equalizer=f={band}:width_type=h:width=200:g={gain}")
-                    filters.extend(eq_parts)
-                
-                # Add noise reduction filter
-                if options.noise_reduction_enabled:
-                    # Use FFmpeg's basic noise reduction
+            # Build FFmpeg filter chain for the remaining effects, applied while
+            # encoding so the processed samples never touch the disk
+            filters = []
+            
+            # Add chorus filter
+            if options.chorus_enabled:
+                filters.append(_chorus_filter(
+                    options.chorus_depth, options.chorus_rate, options.chorus_delay
+                ))
+            
+            # Add equalizer filter unless it was already applied in-process
+            if eq_bands and not NUMBA_AVAILABLE:
+                filters.append(_eq_filter_str(eq_bands))
+            
+            # Add noise reduction filter
+            if options.noise_reduction_enabled:
+                # Use FFmpeg's basic noise reduction
+                if _can_use_filter(self.ffmpeg_path, "anlmdn"):
                     nr_filter = f"anlmdn=s={options.noise_reduction_amount}"
                     filters.append(nr_filter)
-                
-                # Apply filters in FFmpeg
-                filter_chain = ",".join(filters)
-                
-                cmd = [
-                    self.ffmpeg_path, "-y",
-                    "-i", temp_wav_path,
-                    "-af", filter_chain
-                ]
-                
-                # Add format-specific options
-                if options.output_format == AudioFormat.MP3:
-                    cmd.extend(["-c:a", "libmp3lame", "-b:a", options.output_bitrate])
-                elif options.output_format == AudioFormat.FLAC:
-                    cmd.extend(["-c:a", "flac"])
-                elif options.output_format == AudioFormat.WAV:
-                    cmd.extend(["-c:a", "pcm_s16le"])
-                elif options.output_format == AudioFormat.AAC:
-                    cmd.extend(["-c:a", "aac", "-b:a", options.output_bitrate])
-                elif options.output_format == AudioFormat.OGG:
-                    cmd.extend(["-c:a", "libvorbis", "-b:a", options.output_bitrate])
-                
-                # Add metadata if available
-                if original_metadata:
-                    for key, value in original_metadata.to_ffmpeg_metadata().items():
-                        cmd.extend(["-metadata", f"{key}={value}"])
-                
-                cmd.append(output_path)
-                
-                # Execute FFmpeg for final processing
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
-            else:
-                # No additional effects, just convert to final format
-                self.converter.convert_audio(temp_wav_path, output_path, conv_options)
+                else:
+                    logger.warning("FFmpeg lacks the anlmdn filter, skipping noise reduction")
             
-            # Clean up temporary file
-            try:
-                os.remove(temp_wav_path)
-            except Exception:
-                pass
+            # Read the raw 16-bit samples from stdin
+            cmd = [self.ffmpeg_path, "-y", *_QUIET_ARGS]
+            if filters:
+                cmd.extend(["-filter_threads", str(_FILTER_THREADS)])
+            cmd.extend(["-f", "s16le", "-ar", str(sr), "-ac", "1", "-i", "pipe:0"])
+            
+            if filters:
+                cmd.extend(["-af", ",".join(filters)])
+            
+            # Add format-specific options
+            cmd.extend(_CODEC_ARGS[options.output_format](options))
+            cmd.extend(options.encoder_flags)
+            
+            # Add metadata if available
+            if original_metadata:
+                for key, value in original_metadata.to_ffmpeg_metadata().items():
+                    cmd.extend(["-metadata", f"{key}={value}"])
+            
+            cmd.extend(_output_args(output_path, options.output_format))
+            
+            # Quantize to 16-bit PCM, half the bytes of float32 and the same
+            # depth the encoders and the old intermediate WAV used
+            pcm = np.multiply(y, 32767.0, dtype=np.float32)
+            np.clip(pcm, -32768.0, 32767.0, out=pcm)
+            samples = pcm.astype(np.int16)
+            del pcm
+            
+            # Hand FFmpeg the sample buffer itself rather than a bytes copy of it
+            process = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE,
+                stdout=None if output_path == _STDOUT_PATH else subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            streamed = output_path == _STDOUT_PATH
+            _, stderr = process.communicate(memoryview(samples).cast("B"))
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    process.returncode, cmd, stderr=stderr.decode("utf-8", "replace")
+                )
             
             if progress_callback:
                 progress_callback(100.0)
@@ -399,12 +881,136 @@ class AudioProcessor:
             
         except Exception as e:
             logger.error(f"Error processing audio with librosa: {str(e)}")
+            if streamed:
+                # A second encode would be appended to the partial stream
+                raise ValueError(f"Failed to process audio: {str(e)}")
             # Fall back to FFmpeg processing
             logger.info("Falling back to FFmpeg processing")
             return self._process_with_ffmpeg(
                 input_path, output_path, options, original_metadata, progress_callback
             )
     
+    def _load_f32_via_soundfile(self, input_path: str) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Decode an audio file to mono float32 samples with libsndfile.
+        
+        Args:
+            input_path: Path to the input audio file.
+            
+        Returns:
+            A tuple of the samples and the sample rate, or None if libsndfile
+            can't read the file.
+        """
+        try:
+            data, sr = sf.read(input_path, dtype="float32", always_2d=True)
+        except Exception as e:
+            logger.warning(f"libsndfile couldn't read {input_path}, using FFmpeg: {str(e)}")
+            return None
+        
+        # Average the channels, as FFmpeg's downmix to mono does
+        if data.shape[1] == 1:
+            y = np.ascontiguousarray(data[:, 0])
+        else:
+            y = data.mean(axis=1, dtype=np.float32)
+        return y, int(sr)
+    
+    def _load_f32_via_ffmpeg(self, input_path: str,
+                             metadata: Any = None) -> Tuple[np.ndarray, int]:
+        """
+        Decode an audio file to mono float32 samples at its native sample rate.
+        
+        FFmpeg writes the samples into a single buffer sized from the file's
+        duration, avoiding librosa's float64 intermediate and extra copies.
+        Buffers for long files are memory-mapped from a temporary file.
+        
+        Args:
+            input_path: Path to the input audio file.
+            metadata: The file's metadata, if already probed.
+            
+        Returns:
+            A tuple of the samples and the sample rate.
+            
+        Raises:
+            subprocess.CalledProcessError: If FFmpeg fails to decode the file.
+        """
+        sr = 44100
+        expected = 0
+        try:
+            metadata = metadata or self.converter.get_metadata(input_path)
+            if metadata.sample_rate:
+                sr = metadata.sample_rate
+            if metadata.duration:
+                expected = int(metadata.duration * sr)
+        except Exception as e:
+            logger.warning(f"Failed to probe {input_path}, decoding at {sr} Hz: {str(e)}")
+        
+        cmd = [
+            self.ffmpeg_path, "-v", "error",
+            "-i", input_path,
+            "-vn", "-f", "f32le", "-ac", "1", "-ar", str(sr),
+            "pipe:1"
+        ]
+        
+        # A little headroom covers durations the container rounds down
+        backing = None
+        if expected > _MMAP_DECODE_SAMPLES:
+            # Kept open so the mapping can grow; the mapping outlives the file,
+            # which is removed once closed
+            backing = tempfile.TemporaryFile(dir=self.temp_dir)
+            y = np.asarray(np.memmap(backing, dtype=np.float32, mode="w+",
+                                     shape=(expected + sr,)))
+        else:
+            y = np.empty(expected + sr, dtype=np.float32)
+        buffer = memoryview(y).cast("B")
+        filled = 0
+        # Samples read past the end of a heap buffer, in the order they arrived
+        overflow = []
+        
+        try:
+            with tempfile.TemporaryFile() as stderr:
+                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+                try:
+                    while True:
+                        if filled < len(buffer):
+                            count = process.stdout.readinto(buffer[filled:])
+                            if not count:
+                                break
+                            filled += count
+                        elif backing is not None:
+                            # Longer than expected; extend the backing file and
+                            # remap it rather than copying the samples to the heap
+                            buffer.release()
+                            y = np.asarray(np.memmap(backing, dtype=np.float32, mode="r+",
+                                                     shape=(2 * len(y),)))
+                            buffer = memoryview(y).cast("B")
+                        else:
+                            # Longer than expected; collect the rest and join it once
+                            chunk = process.stdout.read(len(buffer))
+                            if not chunk:
+                                break
+                            overflow.append(chunk)
+                finally:
+                    process.stdout.close()
+                    process.wait()
+                    buffer.release()
+                
+                if process.returncode != 0:
+                    stderr.seek(0)
+                    raise subprocess.CalledProcessError(
+                        process.returncode, cmd,
+                        stderr=stderr.read().decode("utf-8", "replace")
+                    )
+        finally:
+            if backing is not None:
+                backing.close()
+        
+        y = y[:filled // y.itemsize]
+        if overflow:
+            y = np.concatenate([y, *(np.frombuffer(chunk, dtype=np.float32,
+                                                   count=len(chunk) // y.itemsize)
+                                     for chunk in overflow)])
+        return y, sr
+    
     def _process_with_ffmpeg(self, input_path: str, output_path: str,
                            options: ProcessingOptions, 
                            original_metadata: Any,
@@ -429,35 +1035,13 @@ class AudioProcessor:
         if options.slow_factor != 1.0:
             if options.preserve_pitch:
                 # Use ATEMPO filter for speed change with pitch preservation
-                # ATEMPO has a limited range (0.5 to 2.0), so chain multiple instances if needed
-                atempo_factor = options.slow_factor
-                
-                # Handle factors outside the valid range
-                if atempo_factor < 0.5:
-                    # Chain multiple atempo filters (e.g., 0.25 = 0.5 * 0.5)
-                    atempo_chain = []
-                    while atempo_factor < 0.5:
-                        atempo_chain.append("atempo=0.5")
-                        atempo_factor /= 0.5
-                    atempo_chain.append(f"atempo={atempo_factor:.4f}")
-                    filters.append(",".join(atempo_chain))
-                elif atempo_factor > 2.0:
-                    # Chain multiple atempo filters (e.g., 4.0 = 2.0 * 2.0)
-                    atempo_chain = []
-                    while atempo_factor > 2.0:
-                        atempo_chain.append("atempo=2.0")
-                        atempo_factor /= 2.0
-                    atempo_chain.append(f"atempo={atempo_factor:.4f}")
-                    filters.append(",".join(atempo_chain))
-                else:
-                    # Within valid range
-                    filters.append(f"atempo={atempo_factor:.4f}")
+                filters.append(_atempo_chain(options.slow_factor))
             else:
                 # Use ASETRATE to change speed (affects pitch)
                 # Get original sample rate
                 original_sr = 44100  # default
                 try:
-                    metadata = self.converter.get_metadata(input_path)
+                    metadata = original_metadata or self.converter.get_metadata(input_path)
                     if metadata and metadata.sample_rate:
                         original_sr = metadata.sample_rate
                 except Exception:
@@ -479,23 +1063,12 @@ class AudioProcessor:
         # Add pitch shift effect
         if options.pitch_enabled and options.pitch_semitones != 0.0:
             # Use RUBBERBAND (if available) or simple asetrate+atempo combination
-            try:
-                # Check if RUBBERBAND is available
-                result = subprocess.run(
-                    [self.ffmpeg_path, "-filters"],
-                    capture_output=True, text=True, check=True
-                )
-                if "rubberband" in result.stdout:
-                    # Use RUBBERBAND for better quality pitch shifting
-                    filters.append(f"rubberband=pitch={options.pitch_semitones}")
-                else:
-                    # Fallback method: combine asetrate and atempo
-                    # This shifts pitch but tries to preserve duration
-                    pitch_factor = 2 ** (options.pitch_semitones / 12.0)
-                    filters.append(f"asetrate={44100 * pitch_factor}")
-                    filters.append(f"atempo={1.0/pitch_factor}")
-            except Exception:
-                # Simple fallback method
+            if _has_filter(self.ffmpeg_path, "rubberband"):
+                # Use RUBBERBAND for better quality pitch shifting
+                filters.append(f"rubberband=pitch={options.pitch_semitones}")
+            else:
+                # Fallback method: combine asetrate and atempo
+                # This shifts pitch but tries to preserve duration
                 pitch_factor = 2 ** (options.pitch_semitones / 12.0)
                 filters.append(f"asetrate={44100 * pitch_factor}")
                 filters.append(f"atempo={1.0/pitch_factor}")
@@ -506,33 +1079,50 @@ class AudioProcessor:
         
         # Add equalizer
         if options.equalizer_enabled and options.equalizer_bands:
-            eq_parts = []
-            for band, gain in options.equalizer_bands.items():
-                eq_parts.append(f"equalizer=f={band}:width_type=h:width=200:g={gain}")
-            filters.extend(eq_parts)
+            filters.append(_eq_filter_str(_eq_bands_key(options.equalizer_bands)))
         
         # Add chorus effect
         if options.chorus_enabled:
-            chorus_filter = (
-                f"chorus=0.5:{options.chorus_depth}:"
-                f"{options.chorus_rate}:{options.chorus_delay * 1000}:0.5:0.5"
-            )
-            filters.append(chorus_filter)
+            filters.append(_chorus_filter(
+                options.chorus_depth, options.chorus_rate, options.chorus_delay
+            ))
         
         # Add noise reduction
         if options.noise_reduction_enabled:
             # Use FFmpeg's basic noise reduction
-            filters.append(f"anlmdn=s={options.noise_reduction_amount}")
+            if _can_use_filter(self.ffmpeg_path, "anlmdn"):
+                filters.append(f"anlmdn=s={options.noise_reduction_amount}")
+            else:
+                logger.warning("FFmpeg lacks the anlmdn filter, skipping noise reduction")
         
         # Add normalization if requested
         if options.normalize_output:
-            filters.append("loudnorm=I=-16:LRA=11:TP=-1.5")
+            loudnorm = _LOUDNORM
+            if not filters and not self.simulation_mode:
+                # With no other effects, the input's loudness is what loudnorm
+                # sees, so measure it first and apply a plain linear gain
+                measured = self._measure_loudness(input_path)
+                if measured:
+                    loudnorm += (
+                        f":measured_I={measured['input_i']}"
+                        f":measured_LRA={measured['input_lra']}"
+                        f":measured_TP={measured['input_tp']}"
+                        f":measured_thresh={measured['input_thresh']}"
+                        f":offset={measured['target_offset']}:linear=true"
+                    )
+            filters.append(loudnorm)
         
-        # Build the FFmpeg command
-        cmd = [
-            self.ffmpeg_path, "-y",
-            "-i", input_path
-        ]
+        # Build the FFmpeg command; stderr only needs the status lines if
+        # progress is being reported
+        cmd = [self.ffmpeg_path, "-y"]
+        if not progress_callback:
+            cmd.extend(_QUIET_ARGS)
+        
+        # Let the filter graph run on several threads; it's a global option
+        if filters:
+            cmd.extend(["-filter_threads", str(_FILTER_THREADS)])
+        
+        cmd.extend(["-i", input_path])
         
         # Add filter chain if any filters were specified
         if filters:
@@ -540,64 +1130,62 @@ class AudioProcessor:
             cmd.extend(["-af", filter_chain])
         
         # Add format-specific options
-        if options.output_format == AudioFormat.MP3:
-            cmd.extend(["-c:a", "libmp3lame", "-b:a", options.output_bitrate])
-        elif options.output_format == AudioFormat.FLAC:
-            cmd.extend(["-c:a", "flac"])
-        elif options.output_format == AudioFormat.WAV:
-            cmd.extend(["-c:a", "pcm_s16le"])
-        elif options.output_format == AudioFormat.AAC:
-            cmd.extend(["-c:a", "aac", "-b:a", options.output_bitrate])
-        elif options.output_format == AudioFormat.OGG:
-            cmd.extend(["-c:a", "libvorbis", "-b:a", options.output_bitrate])
+        cmd.extend(_CODEC_ARGS[options.output_format](options))
+        cmd.extend(options.encoder_flags)
         
         # Add metadata if available
         if original_metadata:
             for key, value in original_metadata.to_ffmpeg_metadata().items():
                 cmd.extend(["-metadata", f"{key}={value}"])
         
-        cmd.append(output_path)
+        cmd.extend(_output_args(output_path, options.output_format))
         
         if self.simulation_mode:
             logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
             # Create a small dummy audio file in simulation mode
-            with open(output_path, "wb") as f:
-                f.write(b"\0" * 1024)  # 1KB dummy file
+            if output_path != _STDOUT_PATH:
+                with open(output_path, "wb") as f:
+                    f.write(b"\0" * 1024)  # 1KB dummy file
             return output_path
         
+        # Streamed output goes straight to our own stdout
+        stdout = None if output_path == _STDOUT_PATH else subprocess.DEVNULL
+        
         try:
             if progress_callback:
                 # Get audio duration for progress calculation
                 duration = self._get_duration(input_path)
                 
                 # Run with progress monitoring
-                process = subprocess.Popen(
-                    cmd, 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True
-                )
+                process = subprocess.Popen(cmd, stdout=stdout, stderr=subprocess.PIPE)
+                fd = process.stderr.fileno()
                 
-                for line in iter(process.stdout.readline, ""):
-                    # Parse time information from FFmpeg output
-                    if "time=" in line:
-                        time_str = line.split("time=")[1].split(" ")[0].strip()
-                        try:
-                            # Convert HH:MM:SS.MS to seconds
-                            h, m, s = time_str.split(":")
-                            current_time = float(h) * 3600 + float(m) * 60 + float(s)
-                            if duration > 0:
-                                progress = min(100.0, (current_time / duration) * 100.0)
-                                progress_callback(progress)
-                        except (ValueError, IndexError):
-                            pass
+                # FFmpeg ends its status lines with \r, so read raw chunks and
+                # only report the latest position in each
+                chunk = b""
+                while True:
+                    data = os.read(fd, 1 << 16)
+                    if not data:
+                        break
+                    chunk = data
+                    
+                    matches = _TIME_RE.findall(chunk)
+                    if matches and duration > 0:
+                        h, m, s = matches[-1]
+                        current_time = int(h) * 3600 + int(m) * 60 + float(s)
+                        progress_callback(min(100.0, (current_time / duration) * 100.0))
                 
+                process.stderr.close()
                 process.wait()
                 if process.returncode != 0:
-                    raise subprocess.CalledProcessError(process.returncode, cmd)
+                    # The last chunk holds FFmpeg's error message
+                    raise subprocess.CalledProcessError(
+                        process.returncode, cmd,
+                        stderr=chunk.decode("utf-8", "replace")
+                    )
             else:
                 # Run without progress monitoring
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
+                subprocess.run(cmd, check=True, stdout=stdout, stderr=subprocess.PIPE, text=True)
                 
             return output_path
             
@@ -612,6 +1200,41 @@ class AudioProcessor:
             logger.error(f"Unexpected error during audio processing: {str(e)}")
             raise
     
+    def _measure_loudness(self, input_path: str) -> Optional[Dict[str, str]]:
+        """
+        Measure a file's loudness with a first loudnorm pass.
+        
+        Args:
+            input_path: Path to the input audio file.
+            
+        Returns:
+            loudnorm's measurements (``input_i``, ``input_lra``, ``input_tp``,
+            ``input_thresh`` and ``target_offset``), or None if the
+            measurement failed or any of them isn't finite.
+        """
+        cmd = [
+            self.ffmpeg_path, "-hide_banner", "-nostats",
+            "-i", input_path,
+            "-vn", "-af", f"{_LOUDNORM}:print_format=json",
+            "-f", "null", os.devnull
+        ]
+        
+        try:
+            result = subprocess.run(
+                cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+            # The measurements are the JSON object at the end of the log
+            stderr = result.stderr
+            measured = json.loads(stderr[stderr.rindex(b"{"):])
+            for key in ("input_i", "input_lra", "input_tp", "input_thresh", "target_offset"):
+                # Silent input measures as "-inf", which the second pass rejects
+                if not math.isfinite(float(measured[key])):
+                    raise ValueError(f"{key} is {measured[key]}")
+            return measured
+        except (OSError, subprocess.CalledProcessError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Couldn't measure loudness, using single-pass loudnorm: {str(e)}")
+            return None
+    
     def preview_effect(self, input_path: str, effect_type: EffectType,
                      options: Optional[ProcessingOptions] = None,
                      duration: float = 10.0,
@@ -632,19 +1255,42 @@ class AudioProcessor:
         Raises:
             ValueError: If the input file doesn't exist or processing fails.
         """
-        if not os.path.exists(input_path):
+        return self.preview_effects(input_path, [effect_type], options, duration, offset)[0]
+    
+    def preview_effects(self, input_path: str, effect_types: List[EffectType],
+                        options: Optional[ProcessingOptions] = None,
+                        duration: float = 10.0,
+                        offset: float = 30.0) -> List[str]:
+        """
+        Create short previews of several effects, rendering them concurrently.
+        
+        The preview segment is cut from the input once and shared by all of the
+        renders.
+        
+        Args:
+            input_path: Path to the input audio file.
+            effect_types: Types of effect to preview.
+            options: Processing options. If None, uses defaults.
+            duration: Duration of each preview in seconds.
+            offset: Starting offset into the audio in seconds.
+            
+        Returns:
+            Paths to the preview audio files, in the same order as ``effect_types``.
+            
+        Raises:
+            ValueError: If the input file doesn't exist or processing fails.
+        """
+        try:
+            st = os.stat(input_path)
+        except FileNotFoundError:
             raise ValueError(f"Input audio file not found: {input_path}")
+        if not effect_types:
+            return []
         
         options = options or ProcessingOptions()
         
-        # Create a temporary file for the preview
-        preview_output = os.path.join(
-            self.temp_dir, 
-            f"preview_{effect_type.name.lower()}.{options.output_format.extension}"
-        )
-        
         # Extract the preview segment from the input file
-        total_duration = self._get_duration(input_path)
+        total_duration = self._get_duration(input_path, st)
         
         # Adjust offset if it exceeds the file duration
         if offset >= total_duration:
@@ -654,14 +1300,13 @@ class AudioProcessor:
         if offset + duration > total_duration:
             duration = max(1.0, total_duration - offset)
         
-        # Create a temporary options object with time range
-        preview_options = ProcessingOptions(**vars(options))
-        
-        # Process the audio segment
-        temp_segment = os.path.join(self.temp_dir, "preview_segment.wav")
+        # Unique segment name so concurrent previews don't overwrite each other
+        fd, temp_segment = tempfile.mkstemp(prefix="preview_segment_", suffix=".wav",
+                                            dir=self.temp_dir)
+        os.close(fd)
         
         cmd = [
-            self.ffmpeg_path, "-y",
+            self.ffmpeg_path, "-y", *_QUIET_ARGS,
             "-i", input_path,
             "-ss", str(offset),
             "-t", str(duration),
@@ -669,100 +1314,296 @@ class AudioProcessor:
             temp_segment
         ]
         
-        if self.simulation_mode:
-            logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
-            # Create a small dummy audio file in simulation mode
-            with open(temp_segment, "wb") as f:
-                f.write(b"\0" * 1024)  # 1KB dummy file
-        else:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Each effect type is rendered once, however often it was requested
+        unique_types = list(dict.fromkeys(effect_types))
+        
+        def render(effect_type: EffectType) -> str:
+            preview_output = os.path.join(
+                self.temp_dir,
+                f"preview_{effect_type.name.lower()}.{options.output_format.extension}"
+            )
+            return self.process_audio(temp_segment, preview_output, options)
         
-        # Process the segment with the desired effect
         try:
-            result = self.process_audio(temp_segment, preview_output, options)
+            if self.simulation_mode:
+                logger.info(f"Simulation mode: Would run command: {' '.join(cmd)}")
+                # Create a small dummy audio file in simulation mode
+                with open(temp_segment, "wb") as f:
+                    f.write(b"\0" * 1024)  # 1KB dummy file
+            else:
+                subprocess.run(
+                    cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+                )
             
-            # Clean up temporary segment
-            try:
-                os.remove(temp_segment)
-            except Exception:
-                pass
-                
-            return result
+            # Renders overlap in FFmpeg subprocesses, numpy calls and the numba
+            # kernels that release the GIL; the parallel kernel is serialized
+            workers = min(len(unique_types), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                paths = dict(zip(unique_types, executor.map(render, unique_types)))
+            return [paths[effect_type] for effect_type in effect_types]
             
         except Exception as e:
+            logger.error(f"Error creating preview: {str(e)}")
+            raise ValueError(f"Failed to create preview: {str(e)}")
+            
+        finally:
             # Clean up temporary segment
             try:
                 os.remove(temp_segment)
             except Exception:
                 pass
-                
-            logger.error(f"Error creating preview: {str(e)}")
-            raise ValueError(f"Failed to create preview: {str(e)}")
     
-    def _get_duration(self, file_path: str) -> float:
+    def _get_duration(self, file_path: str, st: Optional[os.stat_result] = None) -> float:
         """
         Get the duration of a media file in seconds.
         
         Args:
             file_path: Path to the media file.
+            st: The file's ``os.stat`` result, if the caller already has it.
             
         Returns:
             Duration in seconds, or 0 if not available.
         """
         try:
-            metadata = self.converter.get_metadata(file_path)
+            metadata = self.converter.get_metadata(file_path, st)
             return metadata.duration if metadata and metadata.duration else 0
         except Exception:
             logger.warning(f"Couldn't get duration for {file_path}")
             return 0
 
 
+def _warm_up_kernels(parallel: bool = True) -> None:
+    """
+    Compile the numba kernels, or load them from cache, ahead of the first file.
+    
+    Args:
+        parallel: Whether to include the ``parallel=True`` kernel. Running it
+            starts numba's thread pool, which doesn't survive a fork, so a
+            process about to fork workers must leave it out.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    
+    # Same argument types as the processing calls, so the same specializations
+    y = np.zeros(4 * _WSOLA_FRAME, dtype=np.float32)
+    _wsola(y, 0.8, _WSOLA_FRAME, _WSOLA_TOLERANCE, _WSOLA_CORRELATION)
+    _biquad_cascade(y, _eq_coefficients(((1000.0, 0.0),), 44100))
+    if parallel:
+        _normalize_gain(y, 1.0, True, _NORMALIZE_HEADROOM)
+
+
+_cli_processor: Optional[AudioProcessor] = None
+
+
+def _init_cli_worker(ffmpeg_path: str, ffprobe_path: str, temp_dir: str,
+                     simulation_mode: bool) -> None:
+    """Create the processor used by a CLI worker process."""
+    global _cli_processor
+    
+    if get_bool_env("SLOWJAMS_DEBUG", False):
+        import faulthandler
+        faulthandler.enable()
+    
+    _cli_processor = AudioProcessor(ffmpeg_path, ffprobe_path, temp_dir)
+    _cli_processor.simulation_mode = simulation_mode
+    
+    # The parallel kernel's thread pool has to start after the fork, in here
+    _warm_up_kernels()
+
+
+def _part_path(output_path: str) -> str:
+    """Get the sibling path an output is written to before being renamed into place."""
+    root, ext = os.path.splitext(output_path)
+    # Keep the extension last so FFmpeg still picks the muxer from it
+    return f"{root}.part{ext}"
+
+
+def _process_atomically(processor: AudioProcessor, input_path: str, output_path: str,
+                        options: ProcessingOptions,
+                        progress_callback: Optional[Callable[[float], None]] = None) -> str:
+    """
+    Process a file into a temporary sibling, then rename it over the output.
+    
+    A failed run leaves any previous output untouched.
+    """
+    part_path = _part_path(output_path)
+    try:
+        processor.process_audio(input_path, part_path, options, progress_callback)
+        os.replace(part_path, output_path)
+        return output_path
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+def _process_cli_file(input_path: str, output_path: str,
+                      options: ProcessingOptions) -> str:
+    """Process a single file inside a CLI worker process."""
+    return _process_atomically(_cli_processor, input_path, output_path, options)
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
+    import queue
+    import argparse
+    import traceback
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    # Flush status lines as they're written even when piped into another program
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stderr.reconfigure(line_buffering=True)
     
     logging.basicConfig(level=logging.INFO, 
                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
-    if len(sys.argv) < 2:
-        print("Usage: python processor.py <input_file> [output_file]")
-        sys.exit(1)
+    # Debug runs dump native stacks on crashes and track allocations
+    debug = get_bool_env("SLOWJAMS_DEBUG", False)
+    if debug:
+        import faulthandler
+        import tracemalloc
+        faulthandler.enable()
+        tracemalloc.start()
+    
+    parser = argparse.ArgumentParser(
+        description="Apply the slow jam preset to one or more audio files."
+    )
+    parser.add_argument("inputs", nargs="+", help="Input audio files")
+    parser.add_argument(
+        "-o", "--output",
+        help="Output file for a single input (\"-\" streams to stdout), or the "
+             "output directory for several"
+    )
+    args = parser.parse_args()
+    
+    inputs = args.inputs
+    output_file = args.output
+    if len(inputs) > 1 and output_file == _STDOUT_PATH:
+        parser.error("Only a single input can be streamed to stdout")
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    # With "-" the encoded audio streams to stdout, so status goes to stderr
+    status = sys.stderr if output_file == _STDOUT_PATH else sys.stdout
     
     try:
         processor = AudioProcessor()
         
-        # Simple progress callback
+        # Fail fast if FFmpeg or FFprobe can't run, rather than partway through
+        if not processor.simulation_mode:
+            for executable in (processor.ffmpeg_path, processor.ffprobe_path):
+                try:
+                    subprocess.run([executable, "-version"], check=True,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except (OSError, subprocess.CalledProcessError):
+                    raise FileNotFoundError(f"Couldn't run {executable}")
+        
+        # Compile before any work starts. With several inputs the parent forks
+        # workers, so it only fills the cache for the serial kernels and each
+        # worker loads the parallel one itself
+        _warm_up_kernels(parallel=len(inputs) == 1)
+        
+        # Progress goes to stderr, redrawn only when the whole percentage changes
+        progress_out = sys.stderr.buffer
+        last_reported = [-1]
+        
         def progress_callback(progress):
-            print(f"Progress: {progress:.1f}%", end="\r")
+            percent = int(progress)
+            if percent != last_reported[0]:
+                last_reported[0] = percent
+                progress_out.write(b"\rProgress: %d%%" % percent)
+                progress_out.flush()
         
         # Use slow jam preset
         options = ProcessingOptions.slow_jam_preset()
+        if output_file == _STDOUT_PATH:
+            # Hand each packet to the reader as soon as it's muxed
+            options.encoder_flags = ["-flush_packets", "1", "-max_delay", "0"]
         
-        print(f"Processing {input_file} with slow jam preset...")
-        print(f"  Speed: {options.slow_factor:.2f}x")
-        print(f"  Pitch preservation: {options.preserve_pitch}")
-        print(f"  Reverb: {options.reverb_enabled}")
-        
-        # Process the audio
-        result = processor.process_audio(
-            input_file, 
-            output_file, 
-            options,
-            progress_callback
-        )
+        if len(inputs) == 1:
+            input_file = inputs[0]
+            print(f"Processing {input_file} with slow jam preset...", file=status)
+        else:
+            print(f"Processing {len(inputs)} files with slow jam preset...", file=status)
+        print(f"  Speed: {options.slow_factor:.2f}x", file=status)
+        print(f"  Pitch preservation: {options.preserve_pitch}", file=status)
+        print(f"  Reverb: {options.reverb_enabled}", file=status)
+        
+        if len(inputs) == 1:
+            # Process the audio on a worker thread; progress comes back through a
+            # queue so the terminal writes happen here rather than mid-processing
+            progress_queue = queue.Queue()
+            if output_file and output_file != _STDOUT_PATH:
+                process = functools.partial(_process_atomically, processor)
+            else:
+                process = processor.process_audio
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    process,
+                    input_file, 
+                    output_file, 
+                    options,
+                    progress_queue.put_nowait
+                )
+                while not future.done():
+                    try:
+                        progress_callback(progress_queue.get(timeout=0.05))
+                    except queue.Empty:
+                        pass
+                while not progress_queue.empty():
+                    progress_callback(progress_queue.get_nowait())
+                result = future.result()
+                
+            print(f"\nProcessing complete. Output saved to: {result}", file=status)
+        
+        else:
+            # Spread the files across processes, one processor per worker
+            out_dir = output_file or os.getcwd()
+            os.makedirs(out_dir, exist_ok=True)
             
-        print(f"\nProcessing complete. Output saved to: {result}")
+            failed = 0
+            with ProcessPoolExecutor(
+                max_workers=min(len(inputs), os.cpu_count() or 1),
+                initializer=_init_cli_worker,
+                initargs=(processor.ffmpeg_path, processor.ffprobe_path,
+                          processor.temp_dir, processor.simulation_mode)
+            ) as executor:
+                futures = {}
+                for input_file in inputs:
+                    input_name = os.path.splitext(os.path.basename(input_file))[0]
+                    output_path = os.path.join(
+                        out_dir, f"{input_name}_processed.{options.output_format.extension}"
+                    )
+                    futures[executor.submit(
+                        _process_cli_file, input_file, output_path, options
+                    )] = input_file
+                
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        result = future.result()
+                        print(f"[{done}/{len(inputs)}] Output saved to: {result}", file=status)
+                    except Exception as e:
+                        failed += 1
+                        print(f"[{done}/{len(inputs)}] Failed to process "
+                              f"{futures[future]}: {str(e)}", file=status)
+                        if debug:
+                            traceback.print_exception(type(e), e, e.__traceback__, file=status)
+            
+            if failed:
+                print(f"Error: {failed} of {len(inputs)} files failed", file=status)
+                sys.exit(1)
+            print("Processing complete.", file=status)
         
     except ValueError as e:
-        print(f"Error: {str(e)}")
+        print(f"Error: {str(e)}", file=status)
         sys.exit(1)
     except FileNotFoundError as e:
-        print(f"Error: {str(e)}")
-        print("Make sure FFmpeg and FFprobe are installed and in your PATH.")
+        print(f"Error: {str(e)}", file=status)
+        print("Make sure FFmpeg and FFprobe are installed and in your PATH.", file=status)
         sys.exit(1)
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        print(f"Unexpected error: {str(e)}", file=status)
+        if debug:
+            traceback.print_exc(file=status)
+            print("Top allocations:", file=status)
+            for stat in tracemalloc.take_snapshot().statistics("lineno")[:10]:
+                print(f"  {stat}", file=status)
+        sys.exit(1)
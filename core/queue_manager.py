@@ -133,6 +133,7 @@ class QueueTask:
                 "sample_rate": self.conversion_options.sample_rate,
                 "channels": self.conversion_options.channels,
                 "normalize": self.conversion_options.normalize,
+                "normalize_mode": self.conversion_options.normalize_mode,
                 "start_time": self.conversion_options.start_time,
                 "end_time": self.conversion_options.end_time
             }
@@ -194,6 +195,7 @@ class QueueTask:
                 sample_rate=opts.get("sample_rate", 44100),
                 channels=opts.get("channels", 2),
                 normalize=opts.get("normalize", False),
+                normalize_mode=opts.get("normalize_mode", "loudnorm"),
                 start_time=opts.get("start_time"),
                 end_time=opts.get("end_time")
             )
@@ -741,7 +743,8 @@ class QueueManager:
         video_path = downloader.download(
             task.url, 
             task.download_format,
-            progress_callback
+            progress_callback,
+            video_id=metadata.video_id
         )
         
         # Store video path in result data
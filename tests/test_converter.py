@@ -0,0 +1,65 @@
+"""
+Tests for the converter module.
+
+This module contains tests for the tag-only fast path of
+core.converter.AudioConverter.
+"""
+
+import os
+import sys
+import pytest
+
+# Add parent directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+mutagen = pytest.importorskip("mutagen")
+from mutagen.id3 import ID3, COMM, TIT2
+
+# Import module to test
+from core.converter import AudioConverter
+
+# One silent MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, 417 bytes
+_MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+
+@pytest.fixture
+def mp3_with_comment(tmp_path):
+    """An MP3 file carrying a title and a comment."""
+    path = tmp_path / "input.mp3"
+    path.write_bytes(_MP3_FRAME * 20)
+    
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text="Original"))
+    tags.add(COMM(encoding=3, lang="eng", desc="", text="Keep me"))
+    tags.save(str(path))
+    return str(path)
+
+
+class TestCopyWithTags:
+    """Tests for the AudioConverter._copy_with_tags method."""
+    
+    def test_rewrites_easy_tags(self, mp3_with_comment, tmp_path):
+        """Test that tags the easy interface knows are written to a copy."""
+        output = str(tmp_path / "output.mp3")
+        converter = AudioConverter()
+        
+        assert converter._copy_with_tags(mp3_with_comment, output,
+                                         {"title": "New", "track": "3"}) is True
+        
+        tags = ID3(output)
+        assert tags["TIT2"].text == ["New"]
+        assert tags["TRCK"].text == ["3"]
+        assert tags.getall("COMM")[0].text == ["Keep me"]
+        assert ID3(mp3_with_comment)["TIT2"].text == ["Original"]
+    
+    def test_comment_falls_back_to_ffmpeg(self, mp3_with_comment, tmp_path):
+        """Test that a comment, which EasyID3 can't write, skips the fast path."""
+        output = str(tmp_path / "output.mp3")
+        converter = AudioConverter()
+        
+        assert converter._copy_with_tags(mp3_with_comment, output,
+                                         {"title": "New", "comment": "Changed"}) is False
+        assert not os.path.exists(output)
+        assert ID3(mp3_with_comment).getall("COMM")[0].text == ["Keep me"]
@@ -0,0 +1,80 @@
+"""
+Tests for the downloader module.
+
+This module contains table tests for URL classification and
+video ID extraction in core.downloader.
+"""
+
+import os
+import sys
+import pytest
+
+# Add parent directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+# Import module to test
+from core.downloader import (
+    _extract_youtube_id,
+    DownloaderFactory,
+    is_supported_url
+)
+
+
+class TestExtractYoutubeId:
+    """Tests for the _extract_youtube_id function."""
+    
+    @pytest.mark.parametrize("url", [
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=42",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123",
+        "youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/live/dQw4w9WgXcQ?feature=share",
+        "https://www.youtube.com/v/dQw4w9WgXcQ",
+    ])
+    def test_valid_urls(self, url):
+        """Test that the ID is found in every supported URL shape."""
+        assert _extract_youtube_id(url) == "dQw4w9WgXcQ"
+    
+    @pytest.mark.parametrize("url", [
+        "https://youtu.be/dQw4w9WgXcQx",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQx",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQx",
+        "https://www.youtube.com/embed/dQw4w9WgXcQx",
+        "https://www.youtube.com/watch?v=short",
+        "https://www.youtube.com/channel/UC1234567890",
+    ])
+    def test_invalid_urls(self, url):
+        """Test that 12-character and missing IDs are rejected."""
+        with pytest.raises(ValueError):
+            _extract_youtube_id(url)
+
+
+class TestClassify:
+    """Tests for DownloaderFactory.classify and is_supported_url."""
+    
+    @pytest.mark.parametrize("url, platform", [
+        ("https://youtu.be/dQw4w9WgXcQ", "youtube"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "youtube"),
+        ("https://m.youtube.com/watch?v=dQw4w9WgXcQ", "youtube"),
+        ("http://youtube.com/shorts/dQw4w9WgXcQ", "youtube"),
+        ("https://www.youtube.com/live/dQw4w9WgXcQ", "youtube"),
+        ("https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ", "youtube"),
+        ("youtube.com/watch?v=dQw4w9WgXcQ", "youtube"),
+        ("https://twitter.com/user/status/1234567890", "twitter"),
+        ("https://x.com/user/status/1234567890", "twitter"),
+        ("https://example.com/video", None),
+        ("https://notyoutube.com/watch?v=dQw4w9WgXcQ", None),
+        ("https://youtube.com.example.org/watch?v=dQw4w9WgXcQ", None),
+        ("not a url", None),
+    ])
+    def test_classify(self, url, platform):
+        """Test that URLs are classified to the expected platform."""
+        assert DownloaderFactory.classify(url) == platform
+        assert is_supported_url(url) is (platform is not None)
@@ -0,0 +1,183 @@
+"""
+Tests for the processor module.
+
+This module contains numeric tests comparing the in-process effects
+in core.processor against straightforward numpy references, and
+tests for its command-line entry point.
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+import numpy as np
+
+# Add parent directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+# Import module to test
+from core import processor
+from core.processor import (
+    ProcessingOptions,
+    _apply_reverb_np,
+    _eq_coefficients,
+    _normalize_gain,
+    _normalize_gain_np,
+    _reverb_partitions,
+    _REVERB_BLOCK,
+    NUMBA_AVAILABLE
+)
+
+
+def _noise(n, seed=1):
+    """Reproducible float32 test signal."""
+    return np.random.default_rng(seed).standard_normal(n).astype(np.float32) * 0.25
+
+
+class TestApplyReverb:
+    """Tests for the _apply_reverb_np function."""
+    
+    @pytest.mark.parametrize("n", [1, _REVERB_BLOCK, 5000, 3 * _REVERB_BLOCK + 17])
+    def test_matches_direct_convolution(self, n):
+        """Test that partitioned convolution equals np.convolve with the response."""
+        sr = 8000
+        options = ProcessingOptions(reverb_room_size=0.0, reverb_damping=0.0,
+                                    reverb_wet_level=1.0, reverb_dry_level=0.0)
+        
+        # Without damping each partition spectrum is that of a plain slice of the response
+        H = _reverb_partitions(sr, 0.0, 0.0)
+        impulse = np.fft.irfft(H, n=2 * _REVERB_BLOCK, axis=1)[:, :_REVERB_BLOCK].ravel()
+        
+        y = _noise(n)
+        expected = np.convolve(y.astype(np.float64), impulse)[:n]
+        result = _apply_reverb_np(y, sr, options)
+        
+        assert result.shape == y.shape
+        np.testing.assert_allclose(result, expected, atol=1e-4)
+    
+    def test_mixes_dry_and_wet(self):
+        """Test that the dry and wet levels are applied to their own signals."""
+        sr = 8000
+        y = _noise(3000)
+        wet_only = _apply_reverb_np(y, sr, ProcessingOptions(
+            reverb_room_size=0.2, reverb_damping=0.5,
+            reverb_wet_level=1.0, reverb_dry_level=0.0))
+        mixed = _apply_reverb_np(y, sr, ProcessingOptions(
+            reverb_room_size=0.2, reverb_damping=0.5,
+            reverb_wet_level=0.3, reverb_dry_level=0.7))
+        
+        np.testing.assert_allclose(mixed, 0.7 * y + 0.3 * wet_only, atol=1e-5)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+class TestBiquadCascade:
+    """Tests for the _biquad_cascade function."""
+    
+    @staticmethod
+    def _reference(y, coefficients):
+        """Direct form I filtering, one band after another."""
+        try:
+            from scipy.signal import lfilter
+        except ImportError:
+            lfilter = None
+        
+        x = y.astype(np.float64)
+        for b0, b1, b2, a1, a2 in coefficients:
+            if lfilter is not None:
+                x = lfilter([b0, b1, b2], [1.0, a1, a2], x)
+                continue
+            out = np.zeros_like(x)
+            x1 = x2 = y1 = y2 = 0.0
+            for i, xi in enumerate(x):
+                out[i] = b0 * xi + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+                x2, x1 = x1, xi
+                y2, y1 = y1, out[i]
+            x = out
+        return x
+    
+    @pytest.mark.parametrize("bands", [
+        ((1000.0, 6.0),),
+        ((60.0, 4.0), (1000.0, -3.0), (8000.0, 2.5)),
+    ])
+    def test_matches_reference(self, bands):
+        """Test that the cascade matches per-band direct form filtering."""
+        coefficients = _eq_coefficients(bands, 44100)
+        y = _noise(4000)
+        expected = self._reference(y, coefficients)
+        
+        result = processor._biquad_cascade(y.copy(), coefficients)
+        
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+    
+    def test_flat_band_is_identity(self):
+        """Test that a 0 dB band leaves the signal unchanged."""
+        y = _noise(2000)
+        result = processor._biquad_cascade(y.copy(), _eq_coefficients(((1000.0, 0.0),), 44100))
+        
+        np.testing.assert_allclose(result, y, atol=1e-6)
+
+
+class TestNormalizeGain:
+    """Tests for the _normalize_gain kernel and its numpy fallback."""
+    
+    @staticmethod
+    def _reference(y, gain_factor, normalize, headroom):
+        """Gain, then scale the peak to the headroom."""
+        out = y.astype(np.float64) * gain_factor
+        if normalize:
+            peak = np.max(np.abs(out))
+            if peak > 0:
+                out *= headroom / peak
+        return out
+    
+    @pytest.mark.parametrize("normalize_fn", [_normalize_gain, _normalize_gain_np])
+    @pytest.mark.parametrize("gain_factor, normalize", [
+        (1.0, True),
+        (2.0, True),
+        (0.5, False),
+        (1.5, False),
+    ])
+    def test_matches_reference(self, normalize_fn, gain_factor, normalize):
+        """Test gain and peak normalization against the numpy reference."""
+        y = _noise(10000)
+        expected = self._reference(y, gain_factor, normalize, 0.95)
+        
+        result = normalize_fn(y.copy(), gain_factor, normalize, 0.95)
+        
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+    
+    @pytest.mark.parametrize("normalize_fn", [_normalize_gain, _normalize_gain_np])
+    def test_silence_stays_silent(self, normalize_fn):
+        """Test that normalizing silence doesn't divide by zero."""
+        y = np.zeros(1000, dtype=np.float32)
+        
+        result = normalize_fn(y, 2.0, True, 0.95)
+        
+        assert np.all(result == 0.0)
+
+
+class TestCli:
+    """Tests for running core/processor.py as a script."""
+    
+    def test_multiple_inputs_exit(self, tmp_path):
+        """Test that a multi-file run exits once its worker processes are done."""
+        inputs = []
+        for name in ("a.wav", "b.wav"):
+            path = tmp_path / name
+            path.write_bytes(b"\0" * 1024)
+            inputs.append(str(path))
+        out_dir = tmp_path / "out"
+        
+        env = dict(os.environ, SIMULATION_MODE="true")
+        result = subprocess.run(
+            [sys.executable, os.path.join(parent_dir, "core", "processor.py"),
+             *inputs, "-o", str(out_dir)],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True,
+            env=env, timeout=120
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert "Processing complete." in result.stdout
+        assert sorted(os.listdir(out_dir)) == ["a_processed.mp3", "b_processed.mp3"]